@@ -132,6 +132,7 @@ class UserProfile:
     raw_text: str = ""
     # The original text, preserved for debugging
     # Helps when parsing goes wrong and user asks "why didn't you see X?"
+    # Only filled in when parsed with keep_raw=True (saves memory in batches)
 
 
 # =============================================================================
@@ -139,7 +140,7 @@ class UserProfile:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class JobDescription:
     """
     The structured representation of a job posting.
@@ -148,6 +149,9 @@ class JobDescription:
     We separate required vs preferred skills because they need different treatment:
     - Missing a required skill = real gap
     - Missing a preferred skill = opportunity, not a problem
+    
+    The extracted lists are tuples: nothing downstream edits them, and the
+    analyzer can hand out the same cached values for a repeated posting.
     """
 
     title: str
@@ -159,19 +163,19 @@ class JobDescription:
     raw_text: str
     # Original posting text, preserved for debugging
 
-    required_skills: list[str] = field(default_factory=list)
+    required_skills: tuple[str, ...] = ()
     # "Must have", "Required", explicitly stated as mandatory
 
-    preferred_skills: list[str] = field(default_factory=list)
+    preferred_skills: tuple[str, ...] = ()
     # "Nice to have", "Preferred", "Bonus points for"
 
-    responsibilities: list[str] = field(default_factory=list)
+    responsibilities: tuple[str, ...] = ()
     # What the job actually involves day-to-day
 
-    qualifications: list[str] = field(default_factory=list)
+    qualifications: tuple[str, ...] = ()
     # Education requirements, years of experience, certifications
 
-    implicit_expectations: list[str] = field(default_factory=list)
+    implicit_expectations: tuple[str, ...] = ()
     # Inferred from phrases like "fast-paced" (tight deadlines),
     # "self-starter" (minimal supervision), "wear many hats" (broad scope)
     # Helps set realistic expectations for candidates
@@ -224,7 +228,7 @@ class Suggestion:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SectionExplanation:
     """Explanation for changes made to a specific section."""
 
@@ -40,7 +40,11 @@ We accept these limitations for MVP. Users can edit in review.
 """
 
 import re
+import sys
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from operator import itemgetter
 from typing import Optional
 
 from core.models import UserProfile, ContactInfo, CVSection
@@ -95,6 +99,23 @@ SECTION_PATTERNS = {
     ],
 }
 
+# Compiled once at import: a header on its own line inside the full text
+# (for splitting), and a whole already-stripped, lowercased line (for
+# header checks)
+SECTION_HEADER_PATTERNS = [
+    (
+        section_type,
+        re.compile(rf"^[\s]*({pattern})[\s]*[:]*[\s]*$", re.IGNORECASE | re.MULTILINE),
+    )
+    for section_type, patterns in SECTION_PATTERNS.items()
+    for pattern in patterns
+]
+SECTION_HEADER_LINE_PATTERNS = [
+    re.compile(rf"^{pattern}[\s:]*$")
+    for patterns in SECTION_PATTERNS.values()
+    for pattern in patterns
+]
+
 
 # =============================================================================
 # CONTACT INFO PATTERNS
@@ -122,6 +143,15 @@ GITHUB_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# All four contact patterns in one alternation, so the top of the resume is
+# scanned once instead of four times. The group name tells us which one hit.
+CONTACT_PATTERN = re.compile(
+    rf"(?P<email>{EMAIL_PATTERN.pattern})"
+    rf"|(?P<phone>{PHONE_PATTERN.pattern})"
+    rf"|(?P<linkedin>(?i:{LINKEDIN_PATTERN.pattern}))"
+    rf"|(?P<github>(?i:{GITHUB_PATTERN.pattern}))"
+)
+
 
 # =============================================================================
 # DATE PATTERNS
@@ -161,6 +191,33 @@ DATE_RANGE_PATTERN = re.compile(
 # Characters that indicate a bullet point at the start of a line
 BULLET_MARKERS = re.compile(r"^[\s]*[-•*▪◦‣⁃]|^[\s]*\d+[.)]\s")
 
+# A leading "-", "•" or "*" and the space after it, on every line
+BULLET_PREFIX_PATTERN = re.compile(r"^[\s]*[-•*]\s*", re.MULTILINE)
+
+
+# =============================================================================
+# CLEANUP PATTERNS
+# =============================================================================
+
+# PDF page numbers on their own line: "Page 1 of 2" or just "1"
+PAGE_NUMBER_PATTERN = re.compile(r"\n\s*(?:Page\s*)?\d+\s*(?:of\s*\d+)?\s*\n")
+
+# Three or more newlines in a row
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
+# Location: "City, STATE" or "City, State" with an optional ZIP
+LOCATION_PATTERN = re.compile(
+    r"([A-Z][a-z]+(?:\s[A-Z][a-z]+)?)\s*,\s*"
+    r"([A-Z]{2}|[A-Z][a-z]+(?:\s[A-Z][a-z]+)?)"
+    r"(?:\s+\d{5}(?:-\d{4})?)?"  # Optional ZIP
+)
+
+# Skills section: category labels ("Languages:"), any bullet character,
+# and the delimiters between skills (comma, pipe, newline, semicolon)
+SKILL_CATEGORY_LABEL_PATTERN = re.compile(r"[A-Za-z]+\s*:")
+SKILL_BULLET_CHAR_PATTERN = re.compile(r"[-•*▪◦‣⁃]")
+SKILL_DELIMITER_PATTERN = re.compile(r"[,|\n;]")
+
 
 # =============================================================================
 # MAIN PARSER CLASS
@@ -174,17 +231,22 @@ class CVParser:
     Usage:
         parser = CVParser()
         profile = parser.parse(raw_text)
+
+        # Batch use (e.g. a server ingesting many resumes):
+        profiles = parser.parse_many([raw_text_1, raw_text_2, ...])
     
     The parsing is best-effort. We extract what we can and leave the rest empty.
     Users can correct mistakes in the review step.
     """
 
-    def parse(self, raw_text: str) -> UserProfile:
+    def parse(self, raw_text: str, keep_raw: bool = False) -> UserProfile:
         """
         Parse raw CV text into structured UserProfile.
         
         Args:
             raw_text: The raw text extracted from PDF/DOCX or pasted by user
+            keep_raw: Store the original text on profile.raw_text for debugging.
+                Off by default so batch parsing doesn't hold every CV twice.
             
         Returns:
             UserProfile with extracted data (some fields may be empty)
@@ -215,12 +277,44 @@ class CVParser:
             education=education,
             skills=skills,
             projects=projects,
-            raw_text=raw_text,  # Keep original for debugging
+            raw_text=raw_text if keep_raw else "",
         )
 
         logger.info(f"Parsed CV: {name}, {len(experience)} jobs, {len(education)} education, {len(skills)} skills")
         return profile
 
+    def parse_many(
+        self,
+        raw_texts: list[str],
+        keep_raw: bool = False,
+    ) -> list[UserProfile]:
+        """
+        Parse many CVs in parallel, one worker process per CPU core.
+        
+        Parsing is pure CPU work with no shared state, so it scales across
+        processes (threads would just fight over the GIL).
+        
+        Args:
+            raw_texts: Raw CV texts, one per resume
+            keep_raw: Passed through to parse()
+            
+        Returns:
+            UserProfiles in the same order as the input texts
+        """
+        # Not worth spinning up a pool for a single CV
+        if len(raw_texts) < 2:
+            return [self.parse(raw_text, keep_raw) for raw_text in raw_texts]
+
+        worker = partial(CVParser._parse_one, keep_raw=keep_raw)
+        with ProcessPoolExecutor() as executor:
+            # Chunking amortizes the pickling/IPC cost per CV
+            return list(executor.map(worker, raw_texts, chunksize=8))
+
+    @staticmethod
+    def _parse_one(raw_text: str, keep_raw: bool = False) -> UserProfile:
+        """Worker entry point for parse_many (must be picklable)."""
+        return CVParser().parse(raw_text, keep_raw)
+
     # =========================================================================
     # TEXT CLEANING
     # =========================================================================
@@ -238,10 +332,10 @@ class CVParser:
 
         # Remove common PDF artifacts
         # Page numbers like "Page 1 of 2" or just "1" at end of line
-        text = re.sub(r"\n\s*(?:Page\s*)?\d+\s*(?:of\s*\d+)?\s*\n", "\n", text)
+        text = PAGE_NUMBER_PATTERN.sub("\n", text)
 
         # Remove excessive blank lines (keep max 2)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = BLANK_LINES_PATTERN.sub("\n\n", text)
 
         # Strip leading/trailing whitespace from each line
         lines = [line.strip() for line in text.split("\n")]
@@ -267,21 +361,18 @@ class CVParser:
         lines = text.split("\n")[:15]
         top_text = "\n".join(lines)
 
-        # Extract email
-        email_match = EMAIL_PATTERN.search(top_text)
-        email = email_match.group(0) if email_match else ""
+        # Extract email, phone, LinkedIn and GitHub in a single pass.
+        # First hit of each kind wins; stop once we have one of each.
+        found = {}
+        for match in CONTACT_PATTERN.finditer(top_text):
+            found.setdefault(match.lastgroup, match.group(0))
+            if len(found) == len(CONTACT_PATTERN.groupindex):
+                break
 
-        # Extract phone
-        phone_match = PHONE_PATTERN.search(top_text)
-        phone = phone_match.group(0) if phone_match else None
-
-        # Extract LinkedIn
-        linkedin_match = LINKEDIN_PATTERN.search(top_text)
-        linkedin = linkedin_match.group(0) if linkedin_match else None
-
-        # Extract GitHub
-        github_match = GITHUB_PATTERN.search(top_text)
-        github = github_match.group(0) if github_match else None
+        email = found.get("email", "")
+        phone = found.get("phone")
+        linkedin = found.get("linkedin")
+        github = found.get("github")
 
         # Extract name (first substantial line that isn't contact info)
         name = self._extract_name(lines)
@@ -353,13 +444,7 @@ class CVParser:
         This is best-effort. Many formats will be missed.
         """
         # Pattern: City, STATE or City, State
-        location_pattern = re.compile(
-            r"([A-Z][a-z]+(?:\s[A-Z][a-z]+)?)\s*,\s*"
-            r"([A-Z]{2}|[A-Z][a-z]+(?:\s[A-Z][a-z]+)?)"
-            r"(?:\s+\d{5}(?:-\d{4})?)?"  # Optional ZIP
-        )
-
-        match = location_pattern.search(text)
+        match = LOCATION_PATTERN.search(text)
         if match:
             return match.group(0).strip()
 
@@ -380,49 +465,33 @@ class CVParser:
             "skills": "Python, React, SQL...",
         }
         """
-        # Find all section headers and their positions
+        # Find all section headers and their positions, as
+        # (start, end, type) tuples
         section_positions = []
 
-        for section_type, patterns in SECTION_PATTERNS.items():
-            for pattern in patterns:
-                # Look for pattern at start of line (with optional whitespace)
-                regex = re.compile(
-                    rf"^[\s]*({pattern})[\s]*[:]*[\s]*$",
-                    re.IGNORECASE | re.MULTILINE,
-                )
-                for match in regex.finditer(text):
-                    section_positions.append({
-                        "type": section_type,
-                        "start": match.start(),
-                        "end": match.end(),
-                        "header": match.group(0),
-                    })
-
-        # Sort by position
-        section_positions.sort(key=lambda x: x["start"])
-
-        # Remove duplicates (same section type found multiple times)
-        seen_types = set()
-        unique_positions = []
-        for pos in section_positions:
-            if pos["type"] not in seen_types:
-                seen_types.add(pos["type"])
-                unique_positions.append(pos)
-
-        # Extract text for each section
-        sections = {}
-        for i, pos in enumerate(unique_positions):
-            # Section content starts after the header
-            start = pos["end"]
+        for section_type, regex in SECTION_HEADER_PATTERNS:
+            # Look for pattern at start of line (with optional whitespace)
+            for match in regex.finditer(text):
+                section_positions.append((match.start(), match.end(), section_type))
+
+        # Sort by position (stable, so ties keep pattern order)
+        section_positions.sort(key=itemgetter(0))
 
-            # Section ends at the next section (or end of text)
-            if i + 1 < len(unique_positions):
-                end = unique_positions[i + 1]["start"]
-            else:
-                end = len(text)
+        # Remove duplicates (same section type found multiple times):
+        # section type → (start, end) of its first header, in text order
+        unique_positions = {}
+        for start, end, section_type in section_positions:
+            unique_positions.setdefault(section_type, (start, end))
 
-            section_text = text[start:end].strip()
-            sections[pos["type"]] = section_text
+        # Each section ends at the next section's header (or end of text)
+        headers = list(unique_positions.items())
+        ends = [start for _, (start, _) in headers[1:]]
+        ends.append(len(text))
+
+        # Extract text for each section (content starts after the header)
+        sections = {}
+        for (section_type, (_, start)), end in zip(headers, ends):
+            sections[section_type] = text[start:end].strip()
 
         return sections
 
@@ -430,10 +499,9 @@ class CVParser:
         """Check if a line looks like a section header."""
         line_lower = line.lower().strip()
 
-        for patterns in SECTION_PATTERNS.values():
-            for pattern in patterns:
-                if re.match(rf"^{pattern}[\s:]*$", line_lower):
-                    return True
+        for regex in SECTION_HEADER_LINE_PATTERNS:
+            if regex.match(line_lower):
+                return True
 
         return False
 
@@ -451,7 +519,7 @@ class CVParser:
             return ""
 
         # Remove any bullet markers at the start
-        text = re.sub(r"^[\s]*[-•*]\s*", "", text, flags=re.MULTILINE)
+        text = BULLET_PREFIX_PATTERN.sub("", text)
 
         # Join lines into paragraphs
         lines = [line.strip() for line in text.split("\n") if line.strip()]
@@ -584,8 +652,13 @@ class CVParser:
         date_range = ""
         description_points = []
 
+        # Header lines we pull org/date from, so the bullet pass can skip them
+        used_indices = set()
+
         # Look for organization and dates in the first few lines
         for i, line in enumerate(lines[1:4], start=1):
+            is_bullet = bool(BULLET_MARKERS.match(line))
+
             # Check for date range
             date_match = DATE_RANGE_PATTERN.search(line)
             if date_match:
@@ -595,6 +668,9 @@ class CVParser:
                 remaining = remaining.strip("|").strip("-").strip("–").strip()
                 if remaining and not organization:
                     organization = remaining
+                # A dated bullet is still a bullet — keep its text
+                if not is_bullet:
+                    used_indices.add(i)
 
             # Check for organization (line with | separator or before date)
             elif "|" in line:
@@ -605,18 +681,18 @@ class CVParser:
                         date_range = DATE_RANGE_PATTERN.search(part).group(0)
                     elif not organization:
                         organization = part
+                used_indices.add(i)
 
             # If line looks like a company/school name (no bullet, short, has caps)
-            elif not BULLET_MARKERS.match(line) and len(line) < 60:
+            elif not is_bullet and len(line) < 60:
                 if not organization:
                     organization = line
+                    used_indices.add(i)
 
         # Remaining lines are bullet points
-        for line in lines[1:]:
+        for i, line in enumerate(lines[1:], start=1):
             # Skip if we already used this line for org/date
-            if line == organization:
-                continue
-            if date_range and date_range in line and len(line) < 40:
+            if i in used_indices:
                 continue
 
             # Check if it's a bullet point
@@ -664,14 +740,14 @@ class CVParser:
         skills = []
 
         # Remove category labels like "Languages:", "Frameworks:"
-        text = re.sub(r"[A-Za-z]+\s*:", " ", text)
+        text = SKILL_CATEGORY_LABEL_PATTERN.sub(" ", text)
 
         # Remove bullet markers
-        text = re.sub(r"[-•*▪◦‣⁃]", " ", text)
+        text = SKILL_BULLET_CHAR_PATTERN.sub(" ", text)
 
         # Split on common delimiters
         # Comma, pipe, newline, semicolon
-        parts = re.split(r"[,|\n;]", text)
+        parts = SKILL_DELIMITER_PATTERN.split(text)
 
         for part in parts:
             skill = part.strip()
@@ -690,14 +766,16 @@ class CVParser:
 
             skills.append(skill)
 
-        # Remove duplicates while preserving order
+        # Remove duplicates while preserving order.
+        # Skill names repeat across many CVs ("Python", "SQL"), so we intern
+        # them to share one copy and make downstream set lookups cheaper.
         seen = set()
         unique_skills = []
         for skill in skills:
             skill_lower = skill.lower()
             if skill_lower not in seen:
                 seen.add(skill_lower)
-                unique_skills.append(skill)
+                unique_skills.append(sys.intern(skill))
 
         return unique_skills
 
@@ -67,10 +67,12 @@ These will be added when we integrate Claude.
 """
 
 import re
+import sys
 import logging
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Optional
-from copy import deepcopy
 
 from core.models import (
     UserProfile,
@@ -85,6 +87,9 @@ from services.skill_matcher import SkillMatchResult
 
 logger = logging.getLogger(__name__)
 
+# How many distinct bullet rewrites each CVRewriter remembers
+BULLET_CACHE_SIZE = 4096
+
 
 # =============================================================================
 # WEAK VERBS → STRONG VERBS MAPPING
@@ -104,13 +109,92 @@ VERB_UPGRADES = {
     "assisted with": "assisted in",
 }
 
+# All weak verbs compiled into one alternation so each bullet is scanned once.
+# Longest phrases come first so "was responsible for" wins over shorter keys,
+# and word boundaries stop "used" from matching inside "focused".
+# Matched against the bullet's lowercase view (see _lower_view).
+_VERB_RE = re.compile(
+    r"\b("
+    + "|".join(re.escape(k.lower()) for k in sorted(VERB_UPGRADES, key=len, reverse=True))
+    + r")\b"
+)
+_VERB_LOOKUP = {k.lower(): v for k, v in VERB_UPGRADES.items()}
+
+# Used by whitespace cleanup. Runs after whitespace is collapsed,
+# so a single space is all we need to look for.
+_SPACE_BEFORE_PUNCT_RE = re.compile(r" ([.,;:!?])")
+
+
+# =============================================================================
+# SKILL INJECTION PATTERNS
+# =============================================================================
+
+
+def _norm(skill: str) -> str:
+    """
+    Normalize a skill name for lookups.
+    
+    Interned, so the same skill shares one string object across sets and
+    requests, and set lookups can short-circuit on identity.
+    """
+    return sys.intern(skill.lower().strip())
+
+
+# Generic terms that could be made specific, in priority order:
+# (generic_term, skill_category, injection_template)
+INJECTION_PATTERNS = [
+    (generic_term, tuple(_norm(s) for s in skill_options), template)
+    for generic_term, skill_options, template in (
+        ("web application", ["react", "vue", "angular", "next.js"], "web application"),
+        ("frontend", ["react", "vue", "angular"], "frontend"),
+        ("backend", ["node", "python", "java", "go"], "backend"),
+        ("api", ["rest", "graphql"], "API"),
+        ("database", ["postgresql", "mysql", "mongodb", "redis"], "database"),
+        ("cloud", ["aws", "gcp", "azure"], "cloud"),
+        ("mobile app", ["react native", "flutter", "swift", "kotlin"], "mobile app"),
+        ("machine learning", ["tensorflow", "pytorch", "sklearn"], "machine learning"),
+    )
+]
+
+# One alternation finds every generic term in a single pass over the bullet.
+# Only the start is anchored, so "web applications" and "APIs" still match
+# but "api" inside "rapid" does not. Matched against the lowercase view.
+_GENERIC_TERM_RE = re.compile(
+    r"\b(?:"
+    + "|".join(
+        re.escape(term)
+        for term in sorted((p[0] for p in INJECTION_PATTERNS), key=len, reverse=True)
+    )
+    + r")"
+)
+
+# Fast reject: a bullet with no weak verb and no generic term can only
+# need whitespace cleanup, so one scan lets it skip both strategies
+_TRIGGER_RE = re.compile(f"(?:{_VERB_RE.pattern})|(?:{_GENERIC_TERM_RE.pattern})")
+
+# Joins a section's bullets for the trigger scan. Not a word character,
+# so word boundaries behave as at the ends of a single bullet.
+_BULLET_SEP = "\x1f"
+
 # Action verbs that are already strong (don't touch these)
-STRONG_VERBS = {
+STRONG_VERBS: frozenset[str] = frozenset({
     "developed", "built", "created", "designed", "implemented",
     "led", "managed", "architected", "engineered", "deployed",
     "optimized", "improved", "increased", "reduced", "automated",
     "launched", "delivered", "established", "spearheaded", "drove",
-}
+})
+
+
+def _lower_view(text: str) -> str:
+    """
+    Lowercase copy of text with the same length, so match positions
+    found in it can be used to slice the original.
+    """
+    lower = text.lower()
+    if len(lower) == len(text):
+        return lower
+    # A few characters (e.g. 'İ') grow when lowercased; keep those as-is
+    return "".join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text)
 
 
 # =============================================================================
@@ -181,6 +265,14 @@ class CVRewriter:
     - Preserve original meaning always
     """
 
+    def __init__(self):
+        # Bullet rewrites only depend on the bullet text and the viable
+        # injections, so re-tailoring against the same JD (or repeated
+        # template bullets) is served from this cache
+        self._cached_bullet_parts = lru_cache(maxsize=BULLET_CACHE_SIZE)(
+            self._rewrite_bullet_parts
+        )
+
     def rewrite(
         self,
         profile: UserProfile,
@@ -198,38 +290,53 @@ class CVRewriter:
         Returns:
             RewriteResult with suggestions and rewrites
         """
-        print("\n" + "=" * 60)
-        print("CV REWRITER: Starting rule-based rewrite")
-        print("=" * 60)
+        logger.debug("CV rewriter: starting rule-based rewrite")
+
+        # Normalize the matched skills once; both steps below look them up
+        matched_req_lower = frozenset(_norm(s) for s in skill_match.matched_required)
+        matched_pref_lower = frozenset(_norm(s) for s in skill_match.matched_preferred)
 
         # Step 1: Reorder skills
         reordered_skills = self._reorder_skills(
             profile.skills,
-            skill_match,
+            matched_req_lower,
+            matched_pref_lower,
         )
-        print(f"✓ Skills reordered ({len(reordered_skills)} total)")
+        logger.debug("Skills reordered (%d total)", len(reordered_skills))
 
         # Step 2: Collect all skills for injection
         # These are skills in the CV that match the JD
-        injectable_skills = self._get_injectable_skills(profile, skill_match)
-        print(f"✓ Found {len(injectable_skills)} injectable skills")
+        injectable_skills = self._get_injectable_skills(
+            matched_req_lower,
+            matched_pref_lower,
+        )
+        logger.debug("Found %d injectable skills", len(injectable_skills))
+
+        # The viable skills per generic term only depend on the injectable
+        # skills, so resolve them once for every section and bullet
+        active_injections = self._get_active_injections(injectable_skills)
+
+        # Step 3: Rewrite work experience and project sections
+        work_sections = profile.work_experience
+        project_sections = profile.projects
+        section_rewrites = [
+            self._rewrite_section(section, jd, active_injections)
+            for section in work_sections + project_sections
+        ]
 
-        # Step 3: Rewrite work experience sections
-        section_rewrites = []
+        # Step 4: Collect suggestions in CV order
         all_suggestions = []
         all_questions = []
 
-        for section in profile.work_experience:
-            print(f"\n📝 Rewriting: {section.title} @ {section.organization}")
-            
-            rewrite = self._rewrite_section(
-                section,
-                jd,
-                injectable_skills,
-            )
-            section_rewrites.append(rewrite)
-            
-            # Collect suggestions from this section
+        for index, rewrite in enumerate(section_rewrites):
+            is_work = index < len(work_sections)
+            if is_work:
+                section = work_sections[index]
+                logger.debug("Rewrote: %s @ %s", section.title, section.organization)
+            else:
+                section = project_sections[index - len(work_sections)]
+                logger.debug("Rewrote project: %s", section.title)
+
             for bullet_rewrite in rewrite.bullet_rewrites:
                 if bullet_rewrite.original != bullet_rewrite.rewritten:
                     suggestion = Suggestion(
@@ -237,43 +344,20 @@ class CVRewriter:
                         suggested_text=bullet_rewrite.rewritten,
                         reason="; ".join(bullet_rewrite.changes_made),
                         prompt_question=bullet_rewrite.prompt_question,
-                        section_name="work_experience",
+                        section_name="work_experience" if is_work else "projects",
                         confidence=bullet_rewrite.confidence,
                         status="pending",
                     )
                     all_suggestions.append(suggestion)
                     
-                    if bullet_rewrite.prompt_question:
+                    # Only work experience questions are surfaced
+                    if is_work and bullet_rewrite.prompt_question:
                         all_questions.append(bullet_rewrite.prompt_question)
 
-        # Step 4: Rewrite project sections (same logic)
-        for section in profile.projects:
-            print(f"\n📝 Rewriting project: {section.title}")
-            
-            rewrite = self._rewrite_section(
-                section,
-                jd,
-                injectable_skills,
-            )
-            section_rewrites.append(rewrite)
-            
-            for bullet_rewrite in rewrite.bullet_rewrites:
-                if bullet_rewrite.original != bullet_rewrite.rewritten:
-                    suggestion = Suggestion(
-                        original_text=bullet_rewrite.original,
-                        suggested_text=bullet_rewrite.rewritten,
-                        reason="; ".join(bullet_rewrite.changes_made),
-                        prompt_question=bullet_rewrite.prompt_question,
-                        section_name="projects",
-                        confidence=bullet_rewrite.confidence,
-                        status="pending",
-                    )
-                    all_suggestions.append(suggestion)
-
         # Step 5: Build summary
         summary = self._build_summary(section_rewrites, skill_match)
 
-        print(f"\n✅ Rewrite complete: {len(all_suggestions)} suggestions")
+        logger.debug("Rewrite complete: %d suggestions", len(all_suggestions))
 
         return RewriteResult(
             reordered_skills=reordered_skills,
@@ -290,7 +374,8 @@ class CVRewriter:
     def _reorder_skills(
         self,
         original_skills: list[str],
-        skill_match: SkillMatchResult,
+        matched_req_lower: frozenset[str],
+        matched_pref_lower: frozenset[str],
     ) -> list[str]:
         """
         Reorder skills to put matched ones first.
@@ -304,40 +389,41 @@ class CVRewriter:
         - Recruiters scan quickly
         - First 5-6 skills get most attention
         - Matched skills should be visible immediately
+        
+        Args:
+            original_skills: Skills as listed on the CV
+            matched_req_lower: Lowercased matched required skills
+            matched_pref_lower: Lowercased matched preferred skills
         """
-        # Normalize for comparison
-        matched_req_lower = {s.lower() for s in skill_match.matched_required}
-        matched_pref_lower = {s.lower() for s in skill_match.matched_preferred}
+        # Nothing matched (e.g. a JD with no recognizable skills)
+        if not matched_req_lower and not matched_pref_lower:
+            return list(original_skills)
 
-        required = []
-        preferred = []
-        other = []
+        # Bucket index per matched skill; required wins over preferred
+        priority = dict.fromkeys(matched_pref_lower, 1)
+        priority.update(dict.fromkeys(matched_req_lower, 0))
 
+        # One dict probe per skill; buckets keep the CV's original order
+        required, preferred, other = buckets = ([], [], [])
         for skill in original_skills:
-            skill_lower = skill.lower()
-            if skill_lower in matched_req_lower:
-                required.append(skill)
-            elif skill_lower in matched_pref_lower:
-                preferred.append(skill)
-            else:
-                other.append(skill)
+            buckets[priority.get(_norm(skill), 2)].append(skill)
 
         # Combine in priority order
         reordered = required + preferred + other
 
         # Log the reordering
         if required:
-            print(f"   Top skills (required): {', '.join(required[:5])}")
+            logger.debug("Top skills (required): %s", ", ".join(required[:5]))
         if preferred:
-            print(f"   Secondary (preferred): {', '.join(preferred[:3])}")
+            logger.debug("Secondary (preferred): %s", ", ".join(preferred[:3]))
 
         return reordered
 
     def _get_injectable_skills(
         self,
-        profile: UserProfile,
-        skill_match: SkillMatchResult,
-    ) -> set[str]:
+        matched_req_lower: frozenset[str],
+        matched_pref_lower: frozenset[str],
+    ) -> frozenset[str]:
         """
         Get skills that can potentially be injected into bullet points.
         
@@ -345,15 +431,7 @@ class CVRewriter:
         We might make them more explicit in bullet points.
         """
         # Combine matched required and preferred
-        injectable = set()
-        
-        for skill in skill_match.matched_required:
-            injectable.add(skill.lower())
-            
-        for skill in skill_match.matched_preferred:
-            injectable.add(skill.lower())
-
-        return injectable
+        return matched_req_lower | matched_pref_lower
 
     # =========================================================================
     # SECTION REWRITING
@@ -363,33 +441,46 @@ class CVRewriter:
         self,
         section: CVSection,
         jd: JobDescription,
-        injectable_skills: set[str],
+        active_injections: tuple[tuple[str, tuple[str, ...]], ...],
     ) -> SectionRewrite:
         """
         Rewrite a single CV section.
         
         Process each bullet point and apply conservative rewrites.
         """
+        bullets = section.description_points
         bullet_rewrites = []
         skills_added = []
-
-        for bullet in section.description_points:
-            rewrite = self._rewrite_bullet(
-                bullet,
-                injectable_skills,
-                jd,
-            )
+        num_changed = 0
+
+        # One trigger scan for the whole section; bullets it doesn't hit
+        # only need whitespace cleanup
+        triggered = self._find_triggered_bullets(bullets)
+
+        for index, bullet in enumerate(bullets):
+            if index in triggered:
+                rewrite = self._rewrite_bullet(
+                    bullet,
+                    active_injections,
+                    jd,
+                )
+            else:
+                original = bullet.strip()
+                rewrite = BulletRewrite(
+                    original=original,
+                    rewritten=self._clean_whitespace(original),
+                    changes_made=[],
+                    confidence=1.0,
+                )
             bullet_rewrites.append(rewrite)
+
+            if rewrite.original != rewrite.rewritten:
+                num_changed += 1
             
             # Track which skills we added
             skills_added.extend(rewrite.changes_made)
 
         # Build changes summary
-        num_changed = sum(
-            1 for r in bullet_rewrites
-            if r.original != r.rewritten
-        )
-        
         if num_changed == 0:
             changes_summary = "No changes needed - already well-written"
         else:
@@ -398,14 +489,56 @@ class CVRewriter:
         return SectionRewrite(
             section_title=section.title,
             bullet_rewrites=bullet_rewrites,
-            skills_added=list(set(skills_added)),
+            # Deduplicate keeping first-seen order, so output is deterministic
+            skills_added=list(dict.fromkeys(skills_added)),
             changes_summary=changes_summary,
         )
 
+    def _find_triggered_bullets(self, bullets: list[str]) -> set[int]:
+        """
+        Find which bullets contain a weak verb or generic term.
+        
+        The bullets are joined into one buffer so the regex runs once per
+        section, and each hit is mapped back to its bullet by offset.
+        
+        Returns:
+            Indices of bullets the rewrite strategies could change
+        """
+        starts = []
+        offset = 0
+        for bullet in bullets:
+            starts.append(offset)
+            offset += len(bullet) + len(_BULLET_SEP)
+
+        joined_lower = _lower_view(_BULLET_SEP.join(bullets))
+
+        return {
+            bisect_right(starts, match.start()) - 1
+            for match in _TRIGGER_RE.finditer(joined_lower)
+        }
+
+    def _get_active_injections(
+        self,
+        injectable_skills: frozenset[str],
+    ) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        """
+        Map each generic term to the skills that could be injected for it.
+        
+        Terms with no injectable skill are dropped. Skills keep their
+        priority order, and terms keep INJECTION_PATTERNS order. Returned
+        as (generic_term, skills) pairs rather than a dict so it can be
+        part of the bullet cache key.
+        """
+        return tuple(
+            (generic_term, viable)
+            for generic_term, skill_options, _template in INJECTION_PATTERNS
+            if (viable := tuple(s for s in skill_options if s in injectable_skills))
+        )
+
     def _rewrite_bullet(
         self,
         bullet: str,
-        injectable_skills: set[str],
+        active_injections: tuple[tuple[str, tuple[str, ...]], ...],
         jd: JobDescription,
     ) -> BulletRewrite:
         """
@@ -418,21 +551,52 @@ class CVRewriter:
         
         Each change is tracked and explained.
         """
+        original, rewritten, changes_made, confidence, prompt_question = (
+            self._cached_bullet_parts(bullet, active_injections)
+        )
+
+        return BulletRewrite(
+            original=original,
+            rewritten=rewritten,
+            changes_made=list(changes_made),
+            confidence=confidence,
+            prompt_question=prompt_question,
+        )
+
+    def _rewrite_bullet_parts(
+        self,
+        bullet: str,
+        active_injections: tuple[tuple[str, tuple[str, ...]], ...],
+    ) -> tuple[str, str, tuple[str, ...], float, Optional[str]]:
+        """
+        Run the rewrite strategies on one bullet (cached by _rewrite_bullet).
+        
+        Returns plain hashable parts rather than a BulletRewrite so cached
+        results can't be mutated by callers.
+        
+        Returns:
+            (original, rewritten, changes_made, confidence, prompt_question)
+        """
         original = bullet.strip()
         rewritten = original
+        # One lowercase view, kept in step with the text by each strategy
+        rewritten_lower = _lower_view(original)
         changes_made = []
         prompt_question = None
         confidence = 1.0  # Start confident, reduce if we're unsure
 
         # Strategy 1: Upgrade weak verbs
-        rewritten, verb_changes = self._upgrade_verbs(rewritten)
+        rewritten, rewritten_lower, verb_changes = self._upgrade_verbs(
+            rewritten,
+            rewritten_lower,
+        )
         changes_made.extend(verb_changes)
 
         # Strategy 2: Try to inject matched skills
         rewritten, skill_changes, question = self._inject_skills(
             rewritten,
-            injectable_skills,
-            jd,
+            rewritten_lower,
+            active_injections,
         )
         changes_made.extend(skill_changes)
         
@@ -443,19 +607,17 @@ class CVRewriter:
         # Strategy 3: Clean up whitespace
         rewritten = self._clean_whitespace(rewritten)
 
-        return BulletRewrite(
-            original=original,
-            rewritten=rewritten,
-            changes_made=changes_made,
-            confidence=confidence,
-            prompt_question=prompt_question,
-        )
+        return original, rewritten, tuple(changes_made), confidence, prompt_question
 
     # =========================================================================
     # REWRITE STRATEGIES
     # =========================================================================
 
-    def _upgrade_verbs(self, text: str) -> tuple[str, list[str]]:
+    def _upgrade_verbs(
+        self,
+        text: str,
+        text_lower: str,
+    ) -> tuple[str, str, list[str]]:
         """
         Strategy 1: Replace weak verbs with stronger ones.
         
@@ -464,34 +626,49 @@ class CVRewriter:
         Example:
             "Worked on API development" → "Contributed to API development"
         
+        Matches run on the lowercase view; replacements are spliced into
+        the original text (keeping a capitalised first letter) and into
+        the view, so the caller doesn't have to lowercase the result again.
+        
         Returns:
-            (rewritten_text, list_of_changes)
+            (rewritten_text, rewritten_lower, list_of_changes)
         """
-        changes = []
-        result = text
-
-        for weak, strong in VERB_UPGRADES.items():
-            # Case-insensitive search
-            pattern = re.compile(re.escape(weak), re.IGNORECASE)
-            
-            if pattern.search(result):
-                # Preserve original casing of first letter
-                def replace_preserving_case(match):
-                    original = match.group(0)
-                    if original[0].isupper():
-                        return strong.capitalize()
-                    return strong
-                
-                result = pattern.sub(replace_preserving_case, result)
-                changes.append(f"Strengthened verb: '{weak}' → '{strong}'")
+        upgraded = {}
+        parts = []
+        lower_parts = []
+        last = 0
+
+        for match in _VERB_RE.finditer(text_lower):
+            start, end = match.span()
+            weak = match.group(0)
+            strong = _VERB_LOOKUP[weak]
+            upgraded[weak] = strong
+
+            parts.append(text[last:start])
+            lower_parts.append(text_lower[last:start])
+            # Preserve original casing of first letter
+            parts.append(strong.capitalize() if text[start].isupper() else strong)
+            lower_parts.append(strong)
+            last = end
+
+        if not upgraded:
+            return text, text_lower, []
+
+        parts.append(text[last:])
+        lower_parts.append(text_lower[last:])
+
+        changes = [
+            f"Strengthened verb: '{weak}' → '{strong}'"
+            for weak, strong in upgraded.items()
+        ]
 
-        return result, changes
+        return "".join(parts), "".join(lower_parts), changes
 
     def _inject_skills(
         self,
         text: str,
-        injectable_skills: set[str],
-        jd: JobDescription,
+        text_lower: str,
+        active_injections: tuple[tuple[str, tuple[str, ...]], ...],
     ) -> tuple[str, list[str], Optional[str]]:
         """
         Strategy 2: Make implicit skills explicit.
@@ -505,59 +682,47 @@ class CVRewriter:
             "Built web applications" + user knows React + JD wants React
             → "Built React web applications"
             
+        Args:
+            text: The bullet text
+            text_lower: Lowercase view of text (same length, from _lower_view)
+            active_injections: Patterns from _get_active_injections, already
+                limited to skills the user has and the JD wants
+            
         Returns:
             (rewritten_text, list_of_changes, optional_question)
         """
-        changes = []
-        result = text
-        question = None
-        text_lower = text.lower()
-
-        # Look for generic terms that could be made specific
-        injection_patterns = [
-            # (generic_term, skill_category, injection_template)
-            ("web application", ["react", "vue", "angular", "next.js"], "web application"),
-            ("frontend", ["react", "vue", "angular"], "frontend"),
-            ("backend", ["node", "python", "java", "go"], "backend"),
-            ("api", ["rest", "graphql"], "API"),
-            ("database", ["postgresql", "mysql", "mongodb", "redis"], "database"),
-            ("cloud", ["aws", "gcp", "azure"], "cloud"),
-            ("mobile app", ["react native", "flutter", "swift", "kotlin"], "mobile app"),
-            ("machine learning", ["tensorflow", "pytorch", "sklearn"], "machine learning"),
-        ]
+        if not active_injections:
+            return text, [], None
+
+        # Find where each generic term first appears, in one pass
+        term_positions = {}
+        for match in _GENERIC_TERM_RE.finditer(text_lower):
+            term_positions.setdefault(match.group(0), match.start())
+
+        if not term_positions:
+            return text, [], None
+
+        for generic_term, skill_options in active_injections:
+            position = term_positions.get(generic_term)
+            if position is None:
+                continue
 
-        for generic_term, skill_options, template in injection_patterns:
-            if generic_term in text_lower:
-                # Check if user has any of these skills AND they're in JD
-                for skill in skill_options:
-                    if skill in injectable_skills:
-                        # Check if skill is already mentioned
-                        if skill not in text_lower:
-                            # Inject the skill
-                            # Find the generic term and add skill before it
-                            pattern = re.compile(
-                                re.escape(generic_term),
-                                re.IGNORECASE
-                            )
-                            
-                            def inject_skill(match):
-                                original = match.group(0)
-                                return f"{skill.title()} {original}"
-                            
-                            result = pattern.sub(inject_skill, result, count=1)
-                            changes.append(f"Added '{skill}' to make skill explicit")
-                            
-                            # Add verification question
-                            question = f"Did this work involve {skill.title()}?"
-                            
-                            # Only inject one skill per bullet
-                            break
-                            
-                # Only try one pattern per bullet
-                if changes:
-                    break
-
-        return result, changes, question
+            # First viable skill the bullet doesn't already mention
+            skill = next((s for s in skill_options if s not in text_lower), None)
+            if skill is None:
+                continue
+
+            # Add the skill right before the generic term
+            result = f"{text[:position]}{skill.title()} {text[position:]}"
+            changes = [f"Added '{skill}' to make skill explicit"]
+
+            # Add verification question
+            question = f"Did this work involve {skill.title()}?"
+
+            # Only inject one skill per bullet
+            return result, changes, question
+
+        return text, [], None
 
     def _clean_whitespace(self, text: str) -> str:
         """
@@ -567,14 +732,11 @@ class CVRewriter:
         - Trim leading/trailing whitespace
         - Ensure proper punctuation spacing
         """
-        # Remove double spaces
-        result = re.sub(r"\s+", " ", text)
-        
-        # Trim
-        result = result.strip()
+        # Collapse runs of whitespace and trim, without the regex engine
+        result = " ".join(text.split())
         
         # Ensure no space before punctuation
-        result = re.sub(r"\s+([.,;:!?])", r"\1", result)
+        result = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", result)
         
         return result
 
@@ -698,7 +860,8 @@ class CVRewriter:
         """
         Apply rewrites to create new section list.
         
-        Returns deep copies with rewritten bullet points.
+        Returns copies with rewritten bullet points. Only the bullet list
+        changes, so a shallow dataclass copy with a fresh list is enough.
         """
         # Create lookup by title
         rewrite_lookup = {
@@ -708,9 +871,6 @@ class CVRewriter:
 
         result = []
         for section in original_sections:
-            # Deep copy
-            new_section = deepcopy(section)
-            
             # Find corresponding rewrite
             if section.title in rewrite_lookup:
                 rewrite = rewrite_lookup[section.title]
@@ -720,9 +880,11 @@ class CVRewriter:
                     br.rewritten
                     for br in rewrite.bullet_rewrites
                 ]
-                new_section.description_points = new_bullets
+            else:
+                new_bullets = list(section.description_points)
 
-            result.append(new_section)
+            # Copy with its own bullet list so the original is never mutated
+            result.append(replace(section, description_points=new_bullets))
 
         return result
 
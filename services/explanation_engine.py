@@ -54,8 +54,12 @@ TONE GUIDELINES
 
 """
 
+import re
 import logging
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import islice
 from typing import Optional
 
 from core.models import (
@@ -70,6 +74,9 @@ from services.skill_matcher import SkillMatchResult
 
 logger = logging.getLogger(__name__)
 
+# How many explain() results each ExplanationEngine remembers
+EXPLAIN_CACHE_SIZE = 32
+
 
 # =============================================================================
 # EXPLANATION TEMPLATES
@@ -100,6 +107,11 @@ GLOBAL_STRATEGY_TEMPLATES = {
     ),
 }
 
+# Match-percent tiers: below 40 is weak, 40-69 moderate, 70+ strong.
+# _TEMPLATE_NAMES[bisect_right(_THRESHOLDS, pct)] picks the tier.
+_THRESHOLDS = (40, 70)
+_TEMPLATE_NAMES = ("weak_match", "moderate_match", "strong_match")
+
 SKILL_REORDER_TEMPLATES = {
     "moved_up_required": (
         "Moved {skill} higher in your skills list because the job specifically requires it."
@@ -139,12 +151,77 @@ GAP_TEMPLATES = {
 }
 
 
+# =============================================================================
+# TEXT HELPERS
+# =============================================================================
+
+
+# A word for diffing: starts with a word character and may carry inner
+# or trailing tech punctuation ("node.js", "c++", "c#"), but not
+# sentence punctuation ("python." and "api," become "python" and "api").
+_TOKEN_RE = re.compile(r"\w(?:[\w.+#-]*[\w+#])?")
+
+
+@lru_cache(maxsize=1024)
+def _tokens(text: str) -> frozenset[str]:
+    """
+    Lowercased words of a text, as a set.
+    
+    Cached because the review UI re-renders diffs for the same suggestion
+    texts on every rerun.
+    """
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+@lru_cache(maxsize=256)
+def _format_global_strategy(
+    template_name: str,
+    match_percent: int,
+    company: str,
+    top_skills: str,
+    gap_skills: str,
+) -> str:
+    """
+    Fill in a GLOBAL_STRATEGY_TEMPLATES entry.
+    
+    Cached because many CVs get tailored to the same JD, which gives the
+    same handful of inputs over and over.
+    """
+    return GLOBAL_STRATEGY_TEMPLATES[template_name].format(
+        match_percent=match_percent,
+        company=company,
+        top_skills=top_skills,
+        gap_skills=gap_skills,
+    )
+
+
+@lru_cache(maxsize=64)
+def _skill_positions(skills: tuple[str, ...]) -> dict[str, int]:
+    """
+    Lowercased skill → its position in the CV's skills list.
+    
+    Cached on the skills themselves, so explaining the same CV again
+    (e.g. against another JD) reuses the map. Treat it as read-only.
+    """
+    return {skill.lower(): i for i, skill in enumerate(skills)}
+
+
+@lru_cache(maxsize=64)
+def format_section_name(section_name: str) -> str:
+    """
+    Format a section key for display: "work_experience" → "Work Experience".
+    
+    Cached, since the set of section names is tiny.
+    """
+    return section_name.replace("_", " ").title()
+
+
 # =============================================================================
 # EXPLANATION RESULT STRUCTURES
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SkillExplanation:
     """Explanation for a single skill's treatment."""
     skill: str
@@ -163,7 +240,7 @@ class BulletExplanation:
     verification_needed: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GapExplanation:
     """Explanation for a skill gap we couldn't address."""
     skill: str
@@ -172,7 +249,7 @@ class GapExplanation:
     suggestion: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FullExplanation:
     """Complete explanation package for the user."""
     
@@ -193,6 +270,13 @@ class FullExplanation:
     key_points: list[str]
 
 
+@dataclass(slots=True, frozen=True)
+class _ExplainInputs:
+    """explain()'s arguments, hashed and compared by their cache key only."""
+    key: tuple
+    args: tuple = field(compare=False)
+
+
 # =============================================================================
 # MAIN ENGINE CLASS
 # =============================================================================
@@ -216,6 +300,13 @@ class ExplanationEngine:
     No AI, no randomness, same inputs = same outputs.
     """
 
+    def __init__(self):
+        # Because explanations are deterministic, re-previewing an unchanged
+        # CV/JD pair can reuse the last result. Keyed by _explain_cache_key.
+        self._cached_explain = lru_cache(maxsize=EXPLAIN_CACHE_SIZE)(
+            self._explain_inputs
+        )
+
     def explain(
         self,
         original_profile: UserProfile,
@@ -235,46 +326,96 @@ class ExplanationEngine:
         Returns:
             FullExplanation with all explanation types
         """
-        print("\n" + "=" * 60)
-        print("EXPLANATION ENGINE: Generating explanations")
-        print("=" * 60)
+        args = (original_profile, skill_match, jd, suggestions)
+        cached = self._cached_explain(
+            _ExplainInputs(key=self._explain_cache_key(*args), args=args)
+        )
+
+        # Fresh lists so callers can't change the cached result
+        return replace(
+            cached,
+            skill_explanations=list(cached.skill_explanations),
+            section_explanations=list(cached.section_explanations),
+            gap_explanations=list(cached.gap_explanations),
+            key_points=list(cached.key_points),
+        )
 
+    def _explain_cache_key(
+        self,
+        original_profile: UserProfile,
+        skill_match: SkillMatchResult,
+        jd: JobDescription,
+        suggestions: list[Suggestion],
+    ) -> tuple:
+        """
+        Build a hashable key from every input field explain() reads.
+        """
+        return (
+            tuple(original_profile.skills),
+            skill_match.match_score,
+            tuple(skill_match.matched_required),
+            tuple(skill_match.matched_preferred),
+            tuple(skill_match.missing_required),
+            tuple(skill_match.missing_preferred),
+            jd.company,
+            tuple((s.section_name, s.status, s.reason) for s in suggestions),
+        )
+
+    def _explain_inputs(self, inputs: _ExplainInputs) -> FullExplanation:
+        """Unpack explain()'s arguments for the cache (see __init__)."""
+        return self._explain_uncached(*inputs.args)
+
+    def _explain_uncached(
+        self,
+        original_profile: UserProfile,
+        skill_match: SkillMatchResult,
+        jd: JobDescription,
+        suggestions: list[Suggestion],
+    ) -> FullExplanation:
+        """Generate explanations from scratch (see explain())."""
         # Calculate match statistics
         match_percent = int(skill_match.match_score * 100)
-        print(f"📊 Match score: {match_percent}%")
 
         # Generate global strategy
         global_strategy = self._generate_global_strategy(
             skill_match,
             jd,
+            match_percent,
         )
-        print(f"✓ Global strategy generated")
 
         # Generate skill explanations
         skill_explanations = self._generate_skill_explanations(
-            original_profile.skills,
+            _skill_positions(tuple(original_profile.skills)),
             skill_match,
         )
-        print(f"✓ {len(skill_explanations)} skill explanations")
 
         # Generate section explanations
         section_explanations = self._generate_section_explanations(
             suggestions,
         )
-        print(f"✓ {len(section_explanations)} section explanations")
 
         # Generate gap explanations
         gap_explanations = self._generate_gap_explanations(
             skill_match,
         )
-        print(f"✓ {len(gap_explanations)} gap explanations")
 
         # Generate key points for quick reading
         key_points = self._generate_key_points(
             skill_match,
             len(suggestions),
+            match_percent,
+        )
+
+        # One log record for the whole run instead of a line per step
+        logger.debug(
+            "Explanations generated: match %d%%, %d skill, %d section, "
+            "%d gap, %d key points",
+            match_percent,
+            len(skill_explanations),
+            len(section_explanations),
+            len(gap_explanations),
+            len(key_points),
         )
-        print(f"✓ {len(key_points)} key points")
 
         return FullExplanation(
             global_strategy=global_strategy,
@@ -295,13 +436,18 @@ class ExplanationEngine:
         self,
         skill_match: SkillMatchResult,
         jd: JobDescription,
+        match_percent: int,
     ) -> str:
         """
         Generate the high-level strategy explanation.
         
         This is the first thing users see - make it count.
+        
+        Args:
+            skill_match: Result from skill matching
+            jd: The job description
+            match_percent: Match score as a whole percentage (from explain())
         """
-        match_percent = int(skill_match.match_score * 100)
         company = jd.company or "this company"
 
         # Get top matched skills for display
@@ -314,20 +460,15 @@ class ExplanationEngine:
 
         # Choose template based on match level
         if not skill_match.matched_required and not skill_match.missing_required:
-            template = GLOBAL_STRATEGY_TEMPLATES["no_required_skills"]
-            return template
-        elif match_percent >= 70:
-            template = GLOBAL_STRATEGY_TEMPLATES["strong_match"]
-        elif match_percent >= 40:
-            template = GLOBAL_STRATEGY_TEMPLATES["moderate_match"]
-        else:
-            template = GLOBAL_STRATEGY_TEMPLATES["weak_match"]
-
-        return template.format(
-            match_percent=match_percent,
-            company=company,
-            top_skills=top_skills_str,
-            gap_skills=gap_skills_str,
+            return GLOBAL_STRATEGY_TEMPLATES["no_required_skills"]
+        template_name = _TEMPLATE_NAMES[bisect_right(_THRESHOLDS, match_percent)]
+
+        return _format_global_strategy(
+            template_name,
+            match_percent,
+            company,
+            top_skills_str,
+            gap_skills_str,
         )
 
     # =========================================================================
@@ -336,28 +477,37 @@ class ExplanationEngine:
 
     def _generate_skill_explanations(
         self,
-        original_skills: list[str],
+        original_positions: dict[str, int],
         skill_match: SkillMatchResult,
     ) -> list[SkillExplanation]:
         """
         Explain why each skill was reordered (or not).
         
         Focus on the most important changes - don't explain everything.
+        
+        Args:
+            original_positions: Lowercased skill → index in the original
+                CV (from _skill_positions)
+            skill_match: Result from skill matching
         """
         explanations = []
+        limit = 5  # Only the top 5 most important changes are shown
 
-        # Create position lookup for original skills
-        original_positions = {
-            skill.lower(): i
-            for i, skill in enumerate(original_skills)
-        }
+        required = skill_match.matched_required
+        preferred = skill_match.matched_preferred
+        # Lowercase each list in one C-level pass instead of per iteration
+        req_lc = tuple(map(str.lower, required))
+        pref_lc = tuple(map(str.lower, preferred))
 
         # Explain matched required skills (most important)
-        for i, skill in enumerate(skill_match.matched_required):
-            skill_lower = skill.lower()
-            original_pos = original_positions.get(skill_lower, -1)
+        for i, skill_lc in enumerate(req_lc):
+            if len(explanations) >= limit:
+                break
+
+            original_pos = original_positions.get(skill_lc, -1)
             
             if original_pos > i:
+                skill = required[i]
                 # Skill moved up
                 explanations.append(SkillExplanation(
                     skill=skill,
@@ -369,13 +519,20 @@ class ExplanationEngine:
                     to_position=i + 1,
                 ))
 
+        # Preferred skills are placed right after the required ones
+        base = len(required)
+
         # Explain matched preferred skills (if moved significantly)
-        for i, skill in enumerate(skill_match.matched_preferred):
-            skill_lower = skill.lower()
-            original_pos = original_positions.get(skill_lower, -1)
-            new_pos = len(skill_match.matched_required) + i
+        for i, skill_lc in enumerate(pref_lc):
+            # Required changes come first, so stop once the limit is hit
+            if len(explanations) >= limit:
+                break
+
+            original_pos = original_positions.get(skill_lc, -1)
+            new_pos = base + i
             
             if original_pos > new_pos + 3:  # Only if moved up by more than 3
+                skill = preferred[i]
                 explanations.append(SkillExplanation(
                     skill=skill,
                     action="moved_up",
@@ -386,8 +543,7 @@ class ExplanationEngine:
                     to_position=new_pos + 1,
                 ))
 
-        # Limit to top 5 most important changes
-        return explanations[:5]
+        return explanations
 
     # =========================================================================
     # SECTION EXPLANATIONS
@@ -402,36 +558,39 @@ class ExplanationEngine:
         
         Group suggestions by section and summarize.
         """
-        # Group suggestions by section
-        by_section: dict[str, list[Suggestion]] = {}
+        # Group suggestions by section in one pass, keeping only what the
+        # summary needs: [suggestions seen, pending count, sampled reasons]
+        by_section: dict[str, list] = {}
         for suggestion in suggestions:
             section = suggestion.section_name or "unknown"
-            if section not in by_section:
-                by_section[section] = []
-            by_section[section].append(suggestion)
+            stats = by_section.get(section)
+            if stats is None:
+                stats = by_section[section] = [0, 0, {}]
+
+            # Build reasoning from the first 3 suggestions of each section.
+            # An insertion-ordered dict keeps it deterministic, and only
+            # the first 2 distinct reasons are ever shown.
+            reasons = stats[2]
+            if stats[0] < 3 and suggestion.reason and len(reasons) < 2:
+                reasons[suggestion.reason] = None
+            stats[0] += 1
+
+            if suggestion.status == "pending":
+                stats[1] += 1
 
         explanations = []
         
-        for section_name, section_suggestions in by_section.items():
-            # Count accepted vs pending
-            pending = [s for s in section_suggestions if s.status == "pending"]
-            
+        for section_name, (_, pending_count, reasons) in by_section.items():
             # Build changes description
-            if len(pending) == 1:
+            if pending_count == 1:
                 changes = "1 suggested improvement"
             else:
-                changes = f"{len(pending)} suggested improvements"
+                changes = f"{pending_count} suggested improvements"
 
-            # Build reasoning from the suggestions
-            reasons = set()
-            for s in section_suggestions[:3]:  # Sample first 3
-                if s.reason:
-                    reasons.add(s.reason)
-
-            reasoning = "; ".join(list(reasons)[:2]) if reasons else "General improvements for clarity"
+            reasoning = "; ".join(islice(reasons, 2)) if reasons else "General improvements for clarity"
 
             explanations.append(SectionExplanation(
-                section_name=self._format_section_name(section_name),
+                section_name=format_section_name(section_name),
                 changes_made=changes,
                 reasoning=reasoning,
             ))
@@ -481,26 +640,24 @@ class ExplanationEngine:
         self,
         skill_match: SkillMatchResult,
         suggestion_count: int,
+        match_percent: int,
     ) -> list[str]:
         """
         Generate bullet points for quick reading.
         
         These should be scannable in 5 seconds.
         """
-        points = []
-        match_percent = int(skill_match.match_score * 100)
-
         # Overall match
-        points.append(f"Your CV matches {match_percent}% of required skills")
+        points = [f"Your CV matches {match_percent}% of required skills"]
 
         # What matched
         if skill_match.matched_required:
-            matched_str = ", ".join(skill_match.matched_required[:3])
+            matched_str = ", ".join(islice(skill_match.matched_required, 3))
             points.append(f"Strong match on: {matched_str}")
 
         # What's missing
         if skill_match.missing_required:
-            missing_str = ", ".join(skill_match.missing_required[:3])
+            missing_str = ", ".join(islice(skill_match.missing_required, 3))
             points.append(f"Gaps to consider: {missing_str}")
 
         # Changes made
@@ -528,21 +685,12 @@ class ExplanationEngine:
             ["Python", "React"] → "Python and React"
             ["Python", "React", "AWS"] → "Python, React, and AWS"
         """
-        if not skills:
-            return ""
-        if len(skills) == 1:
-            return skills[0]
-        if len(skills) == 2:
-            return f"{skills[0]} and {skills[1]}"
-        return ", ".join(skills[:-1]) + f", and {skills[-1]}"
-
-    def _format_section_name(self, section_name: str) -> str:
-        """
-        Format section name for display.
-        
-        "work_experience" → "Work Experience"
-        """
-        return section_name.replace("_", " ").title()
+        count = len(skills)
+        if count <= 1:
+            return skills[0] if count else ""
+        if count == 2:
+            return " and ".join(skills)
+        return f"{', '.join(skills[:-1])}, and {skills[-1]}"
 
     # =========================================================================
     # CORE MODELS BUILDER
@@ -576,30 +724,24 @@ class ExplanationEngine:
         
         Used when user clicks "Why?" on a specific change.
         """
-        parts = []
-
-        # Start with what changed
-        parts.append(f"Original: \"{suggestion.original_text}\"")
-        parts.append(f"Suggested: \"{suggestion.suggested_text}\"")
-        parts.append("")
-
-        # Explain why
-        if suggestion.reason:
-            parts.append(f"Why: {suggestion.reason}")
-        else:
-            parts.append("Why: General improvement for clarity")
+        # Start with what changed, then explain why
+        parts = [
+            f"Original: \"{suggestion.original_text}\"",
+            f"Suggested: \"{suggestion.suggested_text}\"",
+            "",
+            f"Why: {suggestion.reason or 'General improvement for clarity'}",
+        ]
 
         # Add verification if needed
         if suggestion.prompt_question:
-            parts.append("")
-            parts.append(f"Before accepting, please verify: {suggestion.prompt_question}")
+            parts += ("", f"Before accepting, please verify: {suggestion.prompt_question}")
 
         # Add confidence context
         if suggestion.confidence < 0.8:
-            parts.append("")
-            parts.append(
+            parts += (
+                "",
                 "Note: We're not 100% sure about this change. "
-                "Please review carefully before accepting."
+                "Please review carefully before accepting.",
             )
 
         return "\n".join(parts)
@@ -618,8 +760,8 @@ class ExplanationEngine:
         
         Simple word-level diff for transparency.
         """
-        original_words = set(original.lower().split())
-        rewritten_words = set(rewritten.lower().split())
+        original_words = _tokens(original)
+        rewritten_words = _tokens(rewritten)
 
         added = rewritten_words - original_words
         removed = original_words - rewritten_words
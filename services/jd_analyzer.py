@@ -42,13 +42,20 @@ We accept these for MVP. The review step lets users correct mistakes.
 """
 
 import re
+import sys
 import logging
+from bisect import bisect_left
+from dataclasses import replace
+from functools import lru_cache
 from typing import Optional
 
 from core.models import JobDescription
 
 logger = logging.getLogger(__name__)
 
+# How many analyze() results each JDAnalyzer remembers
+ANALYZE_CACHE_SIZE = 64
+
 
 # =============================================================================
 # SECTION HEADER PATTERNS
@@ -107,6 +114,44 @@ SKIP_SECTION_PATTERNS = [
     r"diversity",
 ]
 
+# Section type → header patterns. If a header line matches patterns of
+# several types, the first type listed here wins.
+SECTION_TYPE_PATTERNS = {
+    "required": REQUIRED_SECTION_PATTERNS,
+    "preferred": PREFERRED_SECTION_PATTERNS,
+    "responsibilities": RESPONSIBILITIES_PATTERNS,
+    "skip": SKIP_SECTION_PATTERNS,
+}
+
+
+def _alternation(patterns: list[str]) -> str:
+    """Join regex strings into one non-capturing alternation."""
+    return "|".join(f"(?:{p})" for p in patterns)
+
+
+# Every section header in one scan. Each type is a named group, so
+# match.lastgroup says which kind of section starts there.
+_SECTION_RE = re.compile(
+    r"^[\s]*(?:"
+    + "|".join(
+        f"(?P<{section_type}>{_alternation(patterns)})"
+        for section_type, patterns in SECTION_TYPE_PATTERNS.items()
+    )
+    + r")[\s]*[:]*[\s]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Whole-line header check for a single, already lowercased line
+_SECTION_HEADER_RE = re.compile(
+    rf"(?:{_alternation([p for ps in SECTION_TYPE_PATTERNS.values() for p in ps])})[\s:]*"
+)
+
+# Header patterns that are just a plain word ("requirements", "benefits"),
+# so the most common headers are recognized without running the regex
+_PLAIN_SECTION_HEADERS = frozenset(
+    p for ps in SECTION_TYPE_PATTERNS.values() for p in ps if p.isalpha()
+)
+
 
 # =============================================================================
 # SKILL INDICATOR PATTERNS
@@ -169,6 +214,61 @@ KNOWN_SKILLS = {
     "project management", "time management",
 }
 
+# All known skills in one scan. The lookahead is zero-width, so finditer
+# tries every position and overlapping mentions are all found; longest
+# skills come first so each position reports its longest match.
+# Skills are lowercase, so these run on lowercased text without IGNORECASE.
+_KNOWN_SKILL_RE = re.compile(
+    r"(?=\b("
+    + "|".join(re.escape(s) for s in sorted(KNOWN_SKILLS, key=len, reverse=True))
+    + r")\b)"
+)
+
+# Shorter skills that start the same way as a longer one ("react" and
+# "react.js"), and their own patterns, to confirm them at the same spot.
+# Skills are interned so every mention found shares one string object.
+_SKILL_PREFIXES = {
+    sys.intern(skill): [
+        sys.intern(other)
+        for other in KNOWN_SKILLS
+        if other != skill and skill.startswith(other)
+    ]
+    for skill in KNOWN_SKILLS
+}
+_PREFIX_SKILL_RES = {
+    prefix: re.compile(rf"\b{re.escape(prefix)}\b")
+    for prefixes in _SKILL_PREFIXES.values()
+    for prefix in prefixes
+}
+
+
+def _known_skill_mentions(text_lower: str) -> list[tuple[int, str]]:
+    """
+    Every known-skill mention in already lowercased text.
+    
+    Returns (position, skill) pairs in text order. Shorter skills found
+    at the same position follow the longer one.
+    """
+    mentions = []
+    for match in _KNOWN_SKILL_RE.finditer(text_lower):
+        start = match.start()
+        skill = sys.intern(match.group(1))
+        mentions.append((start, skill))
+        for prefix in _SKILL_PREFIXES[skill]:
+            if _PREFIX_SKILL_RES[prefix].match(text_lower, start):
+                mentions.append((start, prefix))
+    return mentions
+
+
+def _find_known_skills(text: str) -> list[str]:
+    """
+    Find every known skill mentioned in text, as whole words.
+    
+    Returns each skill once, in order of first mention.
+    """
+    return list(dict.fromkeys(skill for _, skill in _known_skill_mentions(text.lower())))
+
+
 # Phrases that indicate implicit expectations (culture signals)
 IMPLICIT_EXPECTATION_PHRASES = {
     "fast-paced": "Expect tight deadlines and quick pivots",
@@ -187,6 +287,129 @@ IMPLICIT_EXPECTATION_PHRASES = {
     "legacy": "Old codebase, technical debt expected",
 }
 
+# All implicit phrases in one scan of the lowercased text. As with
+# _KNOWN_SKILL_RE, the lookahead lets overlapping phrases ("move fast"
+# in "move fast-paced") all be found. Phrases match anywhere, like `in`.
+_IMPLICIT_RE = re.compile(
+    "(?=("
+    + "|".join(
+        re.escape(p) for p in sorted(IMPLICIT_EXPECTATION_PHRASES, key=len, reverse=True)
+    )
+    + "))"
+)
+
+
+# =============================================================================
+# EXTRACTION PATTERNS (compiled once at import)
+# =============================================================================
+
+# Text cleaning. One translate pass turns stray "\r" line endings into
+# "\n" and odd bullet characters into "•" ("\r\n" pairs are replaced
+# first, since translate maps single characters only).
+_CLEAN_TABLE = str.maketrans({"\r": "\n", **dict.fromkeys("▪◦‣⁃►", "•")})
+_CLEAN_NEWLINES_RE = re.compile(r"\n{3,}")
+
+# Bullet point lines: "- item", "• item", "* item"
+_BULLET_RE = re.compile(r"^[\s]*[-•*]\s*(.+?)$", re.MULTILINE)
+
+# Top-of-posting lines, classified in one match: "Position: Software
+# Engineer" or "Company: Acme" labels (group "title" or "company", with
+# the text in "value"), and "About Acme" headers (group "about")
+_HEADER_LINE_RE = re.compile(
+    r"(?:(?P<title>position|role|job\s*title|title)"
+    r"|(?P<company>company|employer|organization))\s*[:]\s*(?P<value>.+)"
+    r"|about\s+(?P<about>.+?)(?:\s*[-|:]|$)",
+    re.IGNORECASE,
+)
+
+# "About ..." headers that name the role or the poster, not the company
+_NOT_COMPANY_ABOUT = frozenset({"the role", "this role", "the position", "us"})
+
+# Common job title shapes, for an unlabeled first line
+TITLE_PATTERNS = [
+    r"(?:senior|junior|lead|staff|principal|associate)?\s*"
+    r"(?:software|frontend|backend|full\s*stack|data|devops|ml|ai|cloud|platform)?\s*"
+    r"(?:engineer|developer|architect|scientist|analyst|manager|designer)",
+    r"(?:product|project|program|engineering)\s*manager",
+    r"(?:ux|ui|product)\s*designer",
+]
+_TITLE_PATTERN_COMPILED = [re.compile(p, re.IGNORECASE) for p in TITLE_PATTERNS]
+
+# "Acme is hiring" - case-sensitive on purpose: the company name must
+# be capitalized
+_LOOKING_HIRING_RE = re.compile(
+    r"([A-Z][A-Za-z0-9\s&]+?)\s+(?:is\s+)?(?:looking|hiring|seeking)"
+)
+
+# Inline required mentions: "must have experience with X" or "X is required"
+REQUIRED_INLINE_PATTERNS = [
+    r"must\s+have\s+(?:experience\s+(?:with|in)\s+)?(.+?)(?:\.|,|$)",
+    r"(?:required|require[ds]?)\s*[:]\s*(.+?)(?:\.|$)",
+    r"(.+?)\s+is\s+required",
+    r"(.+?)\s+is\s+a\s+must",
+]
+
+# Each inline pattern below is paired with the lowercase words it cannot
+# match without. Checking those with a plain substring test first skips
+# the backtracking "(.+?) is ..." scans on postings that never use them.
+_REQUIRED_INLINE_HINTS = [("must",), ("require",), ("required",), ("must",)]
+_REQUIRED_COMPILED = [
+    (re.compile(pattern, re.IGNORECASE), hints)
+    for pattern, hints in zip(REQUIRED_INLINE_PATTERNS, _REQUIRED_INLINE_HINTS)
+]
+
+# Inline preferred mentions: "nice to have: X" or "X is a plus"
+PREFERRED_INLINE_PATTERNS = [
+    r"nice\s+to\s+have\s*[:]\s*(.+?)(?:\.|$)",
+    r"(?:preferred|bonus|plus)\s*[:]\s*(.+?)(?:\.|$)",
+    r"(.+?)\s+(?:is\s+)?a\s+(?:plus|bonus)",
+    r"ideally\s+(?:you\s+have\s+)?(.+?)(?:\.|$)",
+]
+_PREFERRED_INLINE_HINTS = [
+    ("nice",),
+    ("preferred", "bonus", "plus"),
+    ("plus", "bonus"),
+    ("ideally",),
+]
+_PREFERRED_COMPILED = [
+    (re.compile(pattern, re.IGNORECASE), hints)
+    for pattern, hints in zip(PREFERRED_INLINE_PATTERNS, _PREFERRED_INLINE_HINTS)
+]
+
+# Lead-in words stripped from an unknown-skill bullet
+_SKILL_LEAD_IN_RE = re.compile(
+    r"^(?:experience\s+(?:with|in)|knowledge\s+of|proficiency\s+(?:with|in))\s*",
+    re.IGNORECASE,
+)
+
+# Qualifications: degrees, years of experience, certifications
+DEGREE_PATTERN = (
+    r"(?:bachelor'?s?|master'?s?|ph\.?d\.?|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?b\.?a\.?)"
+    r"(?:\s+(?:degree\s+)?(?:in|of)\s+[\w\s]+)?"
+)
+EXPERIENCE_PATTERN = r"(?P<years>\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)?"
+CERT_PATTERNS = [
+    r"(?:aws|azure|gcp|google)\s+certifi(?:ed|cation)",
+    r"pmp\s+certifi(?:ed|cation)",
+    r"scrum\s+(?:master\s+)?certifi(?:ed|cation)",
+    r"cissp",
+    r"cka|ckad",  # Kubernetes certs
+]
+
+# Degrees, years of experience and every cert pattern in one scan, one
+# named group each. Like _KNOWN_SKILL_RE the alternation sits in a
+# zero-width lookahead, so every position is tried and the caller picks
+# which matches to keep. No two groups can start on the same character
+# (degrees start with b/m/ph, years with a digit, certs with
+# a/g/pm/s/c), so trying them in order at a position loses nothing.
+_QUALIFICATION_RE = re.compile(
+    f"(?=(?P<degree>{DEGREE_PATTERN})|(?P<experience>{EXPERIENCE_PATTERN})"
+    + "".join(f"|(?P<cert{i}>{pattern})" for i, pattern in enumerate(CERT_PATTERNS))
+    + ")",
+    re.IGNORECASE,
+)
+_CERT_ORDER = {f"cert{i}": i for i in range(len(CERT_PATTERNS))}
+
 
 # =============================================================================
 # MAIN ANALYZER CLASS
@@ -205,6 +428,15 @@ class JDAnalyzer:
     Some fields may be empty if we couldn't extract them.
     """
 
+    def __init__(self):
+        # Analysis depends only on the raw text, and the same posting is
+        # usually re-analyzed while the user iterates on their CV.
+        # Keyed by raw_text itself, so a hash collision can't return the
+        # wrong posting.
+        self._cached_analyze = lru_cache(maxsize=ANALYZE_CACHE_SIZE)(
+            self._analyze_uncached
+        )
+
     def analyze(self, raw_text: str) -> JobDescription:
         """
         Analyze job description text and extract structured data.
@@ -215,40 +447,50 @@ class JDAnalyzer:
         Returns:
             JobDescription with extracted fields
         """
+        # A shallow copy is enough (the extracted fields are tuples), and
+        # keeps callers from reassigning fields on the cached result
+        return replace(self._cached_analyze(raw_text))
+
+    def _analyze_uncached(self, raw_text: str) -> JobDescription:
+        """Run the full analysis for analyze() on a cache miss."""
         logger.info("Starting JD analysis")
 
         # Clean up text
         text = self._clean_text(raw_text)
+        text_lower = text.lower()
 
-        # Extract basic info
-        title = self._extract_title(text)
-        company = self._extract_company(text)
+        # Extract basic info (only the first 20 lines are ever looked at,
+        # so don't split the rest; the last item holds the remainder)
+        lines = text.split("\n", 20)
+        header_info = self._classify_header_lines(lines)
+        title = self._extract_title(lines, header_info)
+        company = self._extract_company(text, header_info)
 
         # Split into sections
         sections = self._split_into_sections(text)
 
         # Extract skills from appropriate sections
-        required_skills = self._extract_required_skills(text, sections)
-        preferred_skills = self._extract_preferred_skills(text, sections)
+        required_skills = self._extract_required_skills(text, text_lower, sections)
+        preferred_skills = self._extract_preferred_skills(text, text_lower, sections)
 
         # Extract responsibilities
         responsibilities = self._extract_responsibilities(sections)
 
         # Extract qualifications (education, years of experience)
-        qualifications = self._extract_qualifications(text, sections)
+        qualifications = self._extract_qualifications(text)
 
         # Detect implicit expectations
-        implicit_expectations = self._detect_implicit_expectations(text)
+        implicit_expectations = self._detect_implicit_expectations(text_lower)
 
         jd = JobDescription(
             title=title,
             company=company,
             raw_text=raw_text,
-            required_skills=required_skills,
-            preferred_skills=preferred_skills,
-            responsibilities=responsibilities,
-            qualifications=qualifications,
-            implicit_expectations=implicit_expectations,
+            required_skills=tuple(required_skills),
+            preferred_skills=tuple(preferred_skills),
+            responsibilities=tuple(responsibilities),
+            qualifications=tuple(qualifications),
+            implicit_expectations=tuple(implicit_expectations),
         )
 
         logger.info(
@@ -264,22 +506,55 @@ class JDAnalyzer:
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize job description text."""
-        # Normalize line endings
-        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        # Normalize line endings and bullet characters
+        text = text.replace("\r\n", "\n").translate(_CLEAN_TABLE)
 
         # Remove excessive whitespace
-        text = re.sub(r"\n{3,}", "\n\n", text)
-
-        # Normalize bullet characters
-        text = re.sub(r"[▪◦‣⁃►]", "•", text)
+        text = _CLEAN_NEWLINES_RE.sub("\n\n", text)
 
         return text.strip()
 
+    # =========================================================================
+    # HEADER LINES
+    # =========================================================================
+
+    def _classify_header_lines(self, lines: list[str]) -> dict[str, str]:
+        """
+        Find labeled title/company lines and "About X" headers.
+        
+        One pass over the first 20 lines, shared by title and company
+        extraction. Returns the first value found for each key:
+        - "title": "Position:" style label in the first 10 lines
+        - "company": "Company:" style label in the first 15 lines
+        - "about": "About X" header naming a company, in the first 20 lines
+        Keys with nothing found are left out.
+        """
+        found = {}
+
+        for i, line in enumerate(lines[:20]):
+            match = _HEADER_LINE_RE.match(line)
+            if not match:
+                continue
+
+            if match["title"] is not None:
+                if i < 10:
+                    found.setdefault("title", match["value"].strip())
+            elif match["company"] is not None:
+                if i < 15:
+                    found.setdefault("company", match["value"].strip())
+            elif "about" not in found:
+                company = match["about"].strip()
+                # Avoid matching "About the role" etc.
+                if company.lower() not in _NOT_COMPANY_ABOUT:
+                    found["about"] = company
+
+        return found
+
     # =========================================================================
     # TITLE EXTRACTION
     # =========================================================================
 
-    def _extract_title(self, text: str) -> str:
+    def _extract_title(self, lines: list[str], header_info: dict[str, str]) -> str:
         """
         Extract the job title.
         
@@ -287,19 +562,14 @@ class JDAnalyzer:
         1. Look for "Position:", "Role:", "Job Title:" labels
         2. First line if it looks like a title (short, has caps)
         3. Look for common title patterns (Senior X Engineer, etc.)
+        
+        Args:
+            lines: The cleaned JD text split into lines
+            header_info: Result of _classify_header_lines(lines)
         """
-        lines = text.split("\n")
-
         # Strategy 1: Labeled title
-        for line in lines[:10]:
-            # Match patterns like "Position: Software Engineer"
-            match = re.match(
-                r"(?:position|role|job\s*title|title)\s*[:]\s*(.+)",
-                line,
-                re.IGNORECASE,
-            )
-            if match:
-                return match.group(1).strip()
+        if "title" in header_info:
+            return header_info["title"]
 
         # Strategy 2: First substantial line
         for line in lines[:5]:
@@ -322,16 +592,8 @@ class JDAnalyzer:
                 continue
 
             # Check for common job title patterns
-            title_patterns = [
-                r"(?:senior|junior|lead|staff|principal|associate)?\s*"
-                r"(?:software|frontend|backend|full\s*stack|data|devops|ml|ai|cloud|platform)?\s*"
-                r"(?:engineer|developer|architect|scientist|analyst|manager|designer)",
-                r"(?:product|project|program|engineering)\s*manager",
-                r"(?:ux|ui|product)\s*designer",
-            ]
-
-            for pattern in title_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
+            for pattern in _TITLE_PATTERN_COMPILED:
+                if pattern.search(line):
                     return line
 
             # If first real line and looks like a title (not too many words)
@@ -345,41 +607,29 @@ class JDAnalyzer:
     # COMPANY EXTRACTION
     # =========================================================================
 
-    def _extract_company(self, text: str) -> str:
+    def _extract_company(self, text: str, header_info: dict[str, str]) -> str:
         """
         Extract the company name.
         
         Strategies:
         1. Look for "Company:", "At:", "About [Company]" labels
         2. Look for "at [Company]" or "[Company] is looking" patterns
+        
+        Args:
+            text: The cleaned JD text
+            header_info: Result of _classify_header_lines() on its lines
         """
-        lines = text.split("\n")
-
         # Strategy 1: Labeled company
-        for line in lines[:15]:
-            match = re.match(
-                r"(?:company|employer|organization)\s*[:]\s*(.+)",
-                line,
-                re.IGNORECASE,
-            )
-            if match:
-                return match.group(1).strip()
+        if "company" in header_info:
+            return header_info["company"]
 
         # Strategy 2: "About [Company]" header
-        for line in lines[:20]:
-            match = re.match(r"about\s+(.+?)(?:\s*[-|:]|$)", line, re.IGNORECASE)
-            if match:
-                company = match.group(1).strip()
-                # Avoid matching "About the role" etc.
-                if company.lower() not in ["the role", "this role", "the position", "us"]:
-                    return company
+        if "about" in header_info:
+            return header_info["about"]
 
         # Strategy 3: "[Company] is looking/hiring"
         first_500 = text[:500]
-        match = re.search(
-            r"([A-Z][A-Za-z0-9\s&]+?)\s+(?:is\s+)?(?:looking|hiring|seeking)",
-            first_500,
-        )
+        match = _LOOKING_HIRING_RE.search(first_500)
         if match:
             return match.group(1).strip()
 
@@ -402,48 +652,22 @@ class JDAnalyzer:
         """
         sections = {}
 
-        # Build a combined pattern for all section types
-        all_patterns = {
-            "required": REQUIRED_SECTION_PATTERNS,
-            "preferred": PREFERRED_SECTION_PATTERNS,
-            "responsibilities": RESPONSIBILITIES_PATTERNS,
-            "skip": SKIP_SECTION_PATTERNS,
-        }
+        # Find all section headers (one pass, already in text order)
+        headers = list(_SECTION_RE.finditer(text))
 
-        # Find all section headers
-        section_positions = []
-
-        for section_type, patterns in all_patterns.items():
-            for pattern in patterns:
-                regex = re.compile(
-                    rf"^[\s]*({pattern})[\s]*[:]*[\s]*$",
-                    re.IGNORECASE | re.MULTILINE,
-                )
-                for match in regex.finditer(text):
-                    section_positions.append({
-                        "type": section_type,
-                        "start": match.start(),
-                        "end": match.end(),
-                    })
-
-        # Sort by position
-        section_positions.sort(key=lambda x: x["start"])
+        # Each section runs until the next header starts (or end of text)
+        ends = [match.start() for match in headers[1:]]
+        ends.append(len(text))
 
         # Extract text for each section
-        for i, pos in enumerate(section_positions):
-            section_type = pos["type"]
+        for match, end in zip(headers, ends):
+            section_type = match.lastgroup
 
             # Skip sections we don't care about
             if section_type == "skip":
                 continue
 
-            start = pos["end"]
-            if i + 1 < len(section_positions):
-                end = section_positions[i + 1]["start"]
-            else:
-                end = len(text)
-
-            section_text = text[start:end].strip()
+            section_text = text[match.end():end].strip()
 
             # Append to existing (might have multiple "required" sections)
             if section_type in sections:
@@ -456,26 +680,16 @@ class JDAnalyzer:
     def _is_section_header(self, line: str) -> bool:
         """Check if a line is a section header."""
         line_lower = line.lower().strip()
-
-        all_patterns = (
-            REQUIRED_SECTION_PATTERNS
-            + PREFERRED_SECTION_PATTERNS
-            + RESPONSIBILITIES_PATTERNS
-            + SKIP_SECTION_PATTERNS
-        )
-
-        for pattern in all_patterns:
-            if re.match(rf"^{pattern}[\s:]*$", line_lower):
-                return True
-
-        return False
+        if line_lower.rstrip(": ") in _PLAIN_SECTION_HEADERS:
+            return True
+        return _SECTION_HEADER_RE.fullmatch(line_lower) is not None
 
     # =========================================================================
     # SKILL EXTRACTION
     # =========================================================================
 
     def _extract_required_skills(
-        self, full_text: str, sections: dict[str, str]
+        self, full_text: str, text_lower: str, sections: dict[str, str]
     ) -> list[str]:
         """
         Extract required skills.
@@ -484,6 +698,8 @@ class JDAnalyzer:
         1. Explicit "Required" section
         2. Inline "must have X" mentions
         3. Strong requirements language
+        
+        text_lower is full_text lowercased, for the inline pattern prefilter.
         """
         skills = []
 
@@ -493,17 +709,10 @@ class JDAnalyzer:
             skills.extend(section_skills)
 
         # Source 2: Inline required mentions
-        # Pattern: "must have experience with X" or "X is required"
-        required_patterns = [
-            r"must\s+have\s+(?:experience\s+(?:with|in)\s+)?(.+?)(?:\.|,|$)",
-            r"(?:required|require[ds]?)\s*[:]\s*(.+?)(?:\.|$)",
-            r"(.+?)\s+is\s+required",
-            r"(.+?)\s+is\s+a\s+must",
-        ]
-
-        for pattern in required_patterns:
-            matches = re.findall(pattern, full_text, re.IGNORECASE)
-            for match in matches:
+        for pattern, hints in _REQUIRED_COMPILED:
+            if not any(hint in text_lower for hint in hints):
+                continue
+            for match in pattern.findall(full_text):
                 # Extract individual skills from the match
                 extracted = self._extract_skills_from_text(match)
                 skills.extend(extracted)
@@ -512,7 +721,7 @@ class JDAnalyzer:
         return self._deduplicate_skills(skills)
 
     def _extract_preferred_skills(
-        self, full_text: str, sections: dict[str, str]
+        self, full_text: str, text_lower: str, sections: dict[str, str]
     ) -> list[str]:
         """
         Extract preferred/nice-to-have skills.
@@ -520,6 +729,8 @@ class JDAnalyzer:
         Sources:
         1. Explicit "Preferred" section
         2. Inline "nice to have" mentions
+        
+        text_lower is full_text lowercased, for the inline pattern prefilter.
         """
         skills = []
 
@@ -529,16 +740,10 @@ class JDAnalyzer:
             skills.extend(section_skills)
 
         # Source 2: Inline preferred mentions
-        preferred_patterns = [
-            r"nice\s+to\s+have\s*[:]\s*(.+?)(?:\.|$)",
-            r"(?:preferred|bonus|plus)\s*[:]\s*(.+?)(?:\.|$)",
-            r"(.+?)\s+(?:is\s+)?a\s+(?:plus|bonus)",
-            r"ideally\s+(?:you\s+have\s+)?(.+?)(?:\.|$)",
-        ]
-
-        for pattern in preferred_patterns:
-            matches = re.findall(pattern, full_text, re.IGNORECASE)
-            for match in matches:
+        for pattern, hints in _PREFERRED_COMPILED:
+            if not any(hint in text_lower for hint in hints):
+                continue
+            for match in pattern.findall(full_text):
                 extracted = self._extract_skills_from_text(match)
                 skills.extend(extracted)
 
@@ -555,67 +760,61 @@ class JDAnalyzer:
         """
         skills = []
 
-        # Strategy 1: Extract bullet points
-        bullet_pattern = re.compile(r"^[\s]*[-•*]\s*(.+?)$", re.MULTILINE)
-        bullets = bullet_pattern.findall(text)
+        # Known skills are scanned once over the whole chunk; each bullet
+        # takes the mentions inside its span. Offsets only line up with
+        # text when lowercasing kept its length (it almost always does).
+        text_lower = text.lower()
+        mentions = _known_skill_mentions(text_lower)
+        mention_starts = [start for start, _ in mentions]
+        same_offsets = len(text_lower) == len(text)
 
-        for bullet in bullets:
+        # Strategy 1: Extract bullet points
+        for match in _BULLET_RE.finditer(text):
             # Clean up the bullet text
-            bullet = bullet.strip()
+            bullet = match.group(1).strip()
+
+            if same_offsets:
+                lo = bisect_left(mention_starts, match.start(1))
+                hi = bisect_left(mention_starts, match.end(1), lo)
+                known = list(dict.fromkeys(skill for _, skill in mentions[lo:hi]))
+            else:
+                known = _find_known_skills(bullet)
 
             # Skip if too long (probably a sentence, not a skill)
             if len(bullet) > 100:
-                # Try to extract known skills from it
-                for skill in KNOWN_SKILLS:
-                    if re.search(rf"\b{re.escape(skill)}\b", bullet, re.IGNORECASE):
-                        skills.append(skill)
+                # Keep the known skills from it
+                skills.extend(known)
                 continue
 
             # Check if it contains known skills
-            found_known = False
-            for skill in KNOWN_SKILLS:
-                if re.search(rf"\b{re.escape(skill)}\b", bullet, re.IGNORECASE):
-                    skills.append(skill)
-                    found_known = True
+            skills.extend(known)
 
             # If no known skill, add the bullet as-is (might be a skill we don't know)
-            if not found_known and len(bullet) < 50:
+            if not known and len(bullet) < 50:
                 # Clean up common prefixes
-                bullet = re.sub(
-                    r"^(?:experience\s+(?:with|in)|knowledge\s+of|proficiency\s+(?:with|in))\s*",
-                    "",
-                    bullet,
-                    flags=re.IGNORECASE,
-                )
+                bullet = _SKILL_LEAD_IN_RE.sub("", bullet)
                 if bullet:
                     skills.append(bullet)
 
         # Strategy 2: Look for known skills in prose (non-bullet text)
-        for skill in KNOWN_SKILLS:
-            if re.search(rf"\b{re.escape(skill)}\b", text, re.IGNORECASE):
-                skills.append(skill)
+        skills.extend(dict.fromkeys(skill for _, skill in mentions))
 
         return skills
 
     def _deduplicate_skills(self, skills: list[str]) -> list[str]:
         """Remove duplicate skills while preserving order."""
-        seen = set()
-        unique = []
+        # Normalized key → first stripped skill with that key (original casing)
+        unique = {}
 
         for skill in skills:
-            # Normalize for comparison
-            normalized = skill.lower().strip()
+            stripped = skill.strip()
+            normalized = sys.intern(stripped.lower())
 
-            # Skip empty or very short
-            if len(normalized) < 2:
-                continue
-
-            if normalized not in seen:
-                seen.add(normalized)
-                # Use the original casing
-                unique.append(skill.strip())
+            # Skip empty or very short, keep the first of each duplicate
+            if len(normalized) >= 2 and normalized not in unique:
+                unique[normalized] = stripped
 
-        return unique
+        return list(unique.values())
 
     # =========================================================================
     # RESPONSIBILITIES EXTRACTION
@@ -635,8 +834,7 @@ class JDAnalyzer:
         text = sections["responsibilities"]
 
         # Extract bullet points
-        bullet_pattern = re.compile(r"^[\s]*[-•*]\s*(.+?)$", re.MULTILINE)
-        bullets = bullet_pattern.findall(text)
+        bullets = _BULLET_RE.findall(text)
 
         for bullet in bullets:
             bullet = bullet.strip()
@@ -657,9 +855,7 @@ class JDAnalyzer:
     # QUALIFICATIONS EXTRACTION
     # =========================================================================
 
-    def _extract_qualifications(
-        self, full_text: str, sections: dict[str, str]
-    ) -> list[str]:
+    def _extract_qualifications(self, full_text: str) -> list[str]:
         """
         Extract qualifications (education, experience level).
         
@@ -668,42 +864,32 @@ class JDAnalyzer:
         - "5+ years of experience"
         - "PMP certification"
         """
-        qualifications = []
-
-        # Look for degree requirements
-        degree_patterns = [
-            r"(?:bachelor'?s?|master'?s?|ph\.?d\.?|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?b\.?a\.?)"
-            r"(?:\s+(?:degree\s+)?(?:in|of)\s+[\w\s]+)?",
-        ]
-
-        for pattern in degree_patterns:
-            matches = re.findall(pattern, full_text, re.IGNORECASE)
-            for match in matches:
-                if match.strip():
-                    qualifications.append(match.strip())
-
-        # Look for years of experience
-        experience_pattern = re.compile(
-            r"(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)?",
-            re.IGNORECASE,
-        )
-        matches = experience_pattern.findall(full_text)
-        for years in matches:
-            qualifications.append(f"{years}+ years experience")
-
-        # Look for certifications
-        cert_patterns = [
-            r"(?:aws|azure|gcp|google)\s+certifi(?:ed|cation)",
-            r"pmp\s+certifi(?:ed|cation)",
-            r"scrum\s+(?:master\s+)?certifi(?:ed|cation)",
-            r"cissp",
-            r"cka|ckad",  # Kubernetes certs
-        ]
-
-        for pattern in cert_patterns:
-            if re.search(pattern, full_text, re.IGNORECASE):
-                match = re.search(pattern, full_text, re.IGNORECASE)
-                qualifications.append(match.group(0))
+        degrees = []
+        years = []
+        certs = {}
+        # Degree and experience mentions don't overlap their own kind:
+        # one found inside an earlier mention's span is skipped
+        degree_end = experience_end = 0
+
+        for match in _QUALIFICATION_RE.finditer(full_text):
+            kind = match.lastgroup
+            if kind == "degree":
+                if match.start() >= degree_end:
+                    degree_end = match.end(kind)
+                    degree = match.group(kind).strip()
+                    if degree:
+                        degrees.append(degree)
+            elif kind == "experience":
+                if match.start() >= experience_end:
+                    experience_end = match.end(kind)
+                    years.append(f"{match.group('years')}+ years experience")
+            else:
+                # Certifications: first mention of each
+                certs.setdefault(kind, match.group(kind))
+
+        # Degrees, then years of experience, then certs in pattern order
+        qualifications = degrees + years
+        qualifications.extend(certs[group] for group in sorted(certs, key=_CERT_ORDER.get))
 
         return self._deduplicate_skills(qualifications)[:10]
 
@@ -711,19 +897,18 @@ class JDAnalyzer:
     # IMPLICIT EXPECTATIONS DETECTION
     # =========================================================================
 
-    def _detect_implicit_expectations(self, text: str) -> list[str]:
+    def _detect_implicit_expectations(self, text_lower: str) -> list[str]:
         """
         Detect implicit expectations from culture signals.
         
         These are phrases that hint at what working there is really like.
+        
+        Args:
+            text_lower: The cleaned JD text, already lowercased by analyze()
         """
-        expectations = []
-        text_lower = text.lower()
-
-        for phrase, meaning in IMPLICIT_EXPECTATION_PHRASES.items():
-            if phrase in text_lower:
-                expectations.append(meaning)
-
-        # Deduplicate (some phrases have same meaning)
-        return list(set(expectations))
+        # Deduplicate (some phrases have same meaning), in order of mention
+        return list(dict.fromkeys(
+            IMPLICIT_EXPECTATION_PHRASES[match.group(1)]
+            for match in _IMPLICIT_RE.finditer(text_lower)
+        ))
 
@@ -46,10 +46,12 @@ This lets us match:
 """
 
 import re
+import sys
 import logging
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Optional
-from copy import deepcopy
 
 from core.models import UserProfile, JobDescription, CVSection, SectionAnalysis
 
@@ -130,12 +132,101 @@ SKILL_ALIASES = {
 }
 
 
+# =============================================================================
+# SKILL NORMALIZATION
+# =============================================================================
+
+# File-extension style suffixes dropped from skill names ("express.js")
+SKILL_SUFFIXES = frozenset({"js", "py", "ts", "go", "rs"})
+
+# Punctuation stripped from the ends of skill names ("Python,", "• SQL")
+SKILL_EDGE_PUNCTUATION = ".,;:-•"
+
+
+def _strip_version(text: str, allow_v: bool) -> str:
+    """
+    Remove a trailing version number ("3", "3.10") and the whitespace
+    around it; with allow_v, a "v" right before it goes too ("v18").
+    
+    A backwards scan doing what re.sub(r"\s*v?\d+(\.\d+)*\s*$", "", text)
+    does (\d is isdecimal() and \s is isspace(), as in re), without
+    running the regex engine. Text with no trailing number is returned
+    unchanged.
+    """
+    end = len(text)
+    while end and text[end - 1].isspace():
+        end -= 1
+
+    start = end
+    while start and text[start - 1].isdecimal():
+        start -= 1
+    if start == end:
+        return text
+
+    # Earlier ".digits" groups belong to the same number
+    while start >= 2 and text[start - 1] == "." and text[start - 2].isdecimal():
+        start -= 2
+        while start and text[start - 1].isdecimal():
+            start -= 1
+
+    if allow_v and start and text[start - 1] == "v":
+        start -= 1
+    while start and text[start - 1].isspace():
+        start -= 1
+    return text[:start]
+
+
+@lru_cache(maxsize=4096)
+def _normalize_skill_cached(skill: str) -> str:
+    """
+    Normalize a single skill name (see SkillMatcher._normalize_skill).
+    
+    Cached because the same skills are normalized over and over: for the
+    CV and JD sets, their lookups, and again for every section analyzed.
+    """
+    # Strip whitespace, then common punctuation at edges, then lowercase
+    # (lowercasing never adds or removes edge characters, so it can come
+    # last and work on the shorter string)
+    normalized = skill.strip().strip(SKILL_EDGE_PUNCTUATION).lower()
+
+    # Remove version numbers (e.g., "Python 3.10" → "Python"). Two
+    # passes, so two trailing numbers go too ("python3 2" → "python").
+    normalized = _strip_version(normalized, allow_v=False)
+    normalized = _strip_version(normalized, allow_v=True)
+
+    # Check aliases first (before removing suffixes)
+    normalized = SKILL_ALIASES.get(normalized, normalized)
+
+    # Remove a common suffix if still present, then check aliases again.
+    # Only needed after a suffix is removed: alias targets are never
+    # alias keys themselves, so a second lookup would change nothing.
+    if "." in normalized:
+        head, _, tail = normalized.rpartition(".")
+        if tail in SKILL_SUFFIXES:
+            normalized = SKILL_ALIASES.get(head, head)
+
+    # Interned, so every normalized form of a skill is one shared string
+    # and set operations on them usually compare by identity
+    return sys.intern(normalized.strip())
+
+
 # =============================================================================
 # MATCH RESULT STRUCTURE
 # =============================================================================
 
+# Match-score tiers: below 0.4 needs work, 0.4-0.7 moderate, 0.7+ strong.
+# _STATUS_NAMES[bisect_right(_STATUS_THRESHOLDS, score)] picks the tier.
+_STATUS_THRESHOLDS = (0.4, 0.7)
+_STATUS_NAMES = ("needs_work", "moderate", "strong")
+
+# How many missing required skills the UI names in its gaps reminder
+MISSING_PREVIEW_SIZE = 5
+
+# How many match_skills results are remembered (per process)
+MATCH_CACHE_SIZE = 256
 
-@dataclass
+
+@dataclass(slots=True)
 class SkillMatchResult:
     """
     The result of comparing CV skills against JD requirements.
@@ -163,6 +254,14 @@ class SkillMatchResult:
     # Based on required skills only — preferred are bonus
     match_score: float = 0.0
     
+    # Lowercased matched skills, for case-insensitive lookups when
+    # highlighting the CV (built once here, not on every UI rerun)
+    matched_required_lower: frozenset[str] = frozenset()
+    matched_preferred_lower: frozenset[str] = frozenset()
+    
+    # First few missing required skills, as shown in the UI's gaps reminder
+    missing_required_preview: tuple[str, ...] = ()
+    
     def __repr__(self) -> str:
         return (
             f"SkillMatchResult("
@@ -175,6 +274,195 @@ class SkillMatchResult:
         )
 
 
+# =============================================================================
+# SKILL MATCHING
+# =============================================================================
+
+def _create_lookup(skills: tuple[str, ...]) -> dict[str, str]:
+    """
+    Normalize a list of skills once, mapping normalized → original name.
+    
+    This lets us report the original name (e.g., "React.js") while
+    matching on normalized form (e.g., "react"). The keys double as the
+    set of normalized skills.
+    """
+    lookup = {}
+    for skill in skills:
+        normalized = _normalize_skill_cached(skill)
+        if normalized:  # Skip empty strings
+            # Keep the first occurrence's casing
+            lookup.setdefault(normalized, skill)
+    return lookup
+
+
+@lru_cache(maxsize=MATCH_CACHE_SIZE)
+def _match_skills_cached(
+    cv_skills: tuple[str, ...],
+    required_skills: tuple[str, ...],
+    preferred_skills: tuple[str, ...],
+) -> SkillMatchResult:
+    """
+    The matching behind SkillMatcher.match_skills.
+    
+    Matching is deterministic, and the same CV and JD skills come back on
+    every Streamlit rerun (or when one CV is tried against several JDs),
+    so results are cached on the skill tuples. Treat the returned result
+    as read-only; match_skills hands callers a copy.
+    """
+    # No JD skills at all: nothing can match or be missing, every CV
+    # skill is extra, and (as below) no required skills = good match
+    if not required_skills and not preferred_skills:
+        cv_lookup = _create_lookup(cv_skills)
+        return SkillMatchResult(
+            extra_skills=sorted(cv_lookup.values()),
+            match_score=1.0,
+        )
+
+    # Normalize all skills for comparison, with lookup maps:
+    # normalized → original
+    # This lets us report the original skill names, not normalized ones
+    cv_lookup = _create_lookup(cv_skills)
+    required_lookup = _create_lookup(required_skills)
+    preferred_lookup = _create_lookup(preferred_skills)
+
+    # Find matches and gaps: one pass over each JD lookup splits its
+    # skills by whether the CV has them, already as original names
+    matched_required, missing_required = [], []
+    for normalized, skill in required_lookup.items():
+        if normalized in cv_lookup:
+            matched_required.append(skill)
+        else:
+            missing_required.append(skill)
+
+    matched_preferred, missing_preferred = [], []
+    for normalized, skill in preferred_lookup.items():
+        if normalized in cv_lookup:
+            matched_preferred.append(skill)
+        else:
+            missing_preferred.append(skill)
+
+    # Extra skills: in CV but not in any JD category
+    extra_skills = [
+        skill for normalized, skill in cv_lookup.items()
+        if normalized not in required_lookup
+        and normalized not in preferred_lookup
+    ]
+
+    # Sorted for display
+    matched_required.sort()
+    matched_preferred.sort()
+    missing_required.sort()
+    missing_preferred.sort()
+    extra_skills.sort()
+
+    # Calculate match score based on required skills only
+    if len(required_lookup) > 0:
+        match_score = len(matched_required) / len(required_lookup)
+    else:
+        # No required skills specified = assume good match
+        match_score = 1.0
+
+    return SkillMatchResult(
+        matched_required=matched_required,
+        matched_preferred=matched_preferred,
+        missing_required=missing_required,
+        missing_preferred=missing_preferred,
+        extra_skills=extra_skills,
+        match_score=match_score,
+        matched_required_lower=frozenset(map(str.lower, matched_required)),
+        matched_preferred_lower=frozenset(map(str.lower, matched_preferred)),
+        missing_required_preview=tuple(missing_required[:MISSING_PREVIEW_SIZE]),
+    )
+
+
+# =============================================================================
+# SECTION ANALYSIS STRUCTURES
+# =============================================================================
+
+
+@dataclass(slots=True)
+class JDIndex:
+    """
+    JD skills prepared once per match() for section analysis.
+    
+    Every section is checked against the same JD skills, so their
+    lowercased and normalized forms are computed here once rather than
+    again for each work experience, project and education entry.
+    """
+    
+    # All JD skills (required first, then preferred), as written in the JD
+    all_skills: list[str] = field(default_factory=list)
+    
+    # (lowercased, normalized) for each required skill, in JD order —
+    # the required skills are also the head of all_skills
+    required_lower_norm: list[tuple[str, str]] = field(default_factory=list)
+    
+    # One pattern finding every lowercased/normalized skill form in a
+    # section's text (None if there are none), and for each form it can
+    # find, the all_skills indices that a hit on it means are mentioned
+    mention_pattern: Optional[re.Pattern] = None
+    skills_by_mention: dict[str, list[int]] = field(default_factory=dict)
+    
+    # Indices of skills with an empty form, which every text "mentions"
+    always_mentioned: list[int] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SectionCtx:
+    """
+    One CV section's text, lowercased once for its analysis.
+    
+    The role and description checks depend only on the section, so they
+    are worked out here once rather than again for every candidate gap.
+    """
+    
+    # Description points + title + organization, as searched for skills
+    text_lower: str = ""
+    
+    # Title names a technical role / description uses technical terms
+    is_tech_role: bool = False
+    has_tech_description: bool = False
+
+
+# =============================================================================
+# SECTION FIT HEURISTICS
+# =============================================================================
+
+# Technical role indicators (looked for in the section title)
+TECH_ROLE_WORDS = [
+    "engineer", "developer", "programmer", "architect",
+    "scientist", "analyst", "devops", "sre", "infrastructure",
+    "software", "frontend", "backend", "fullstack", "full-stack",
+    "data", "ml", "machine learning", "ai",
+]
+
+# Technical skill indicators (looked for in the skill name)
+TECH_SKILL_WORDS = [
+    "python", "java", "react", "node", "sql", "aws", "docker",
+    "kubernetes", "api", "database", "cloud", "linux", "git",
+]
+
+# Technical terms (looked for in the section description)
+TECH_DESCRIPTION_WORDS = [
+    "code", "develop", "build", "implement", "deploy",
+    "software", "application", "system", "platform",
+    "database", "api", "service", "infrastructure",
+]
+
+# Management/soft skills (looked for in the skill name)
+SOFT_SKILL_WORDS = [
+    "leadership", "management", "communication", "teamwork",
+    "agile", "scrum", "project management",
+]
+
+# Each list as one alternation, so a check is a single search rather than
+# a substring test per word. Words match anywhere, like `in`.
+_TECH_ROLE_RE = re.compile("|".join(map(re.escape, TECH_ROLE_WORDS)))
+_TECH_SKILL_RE = re.compile("|".join(map(re.escape, TECH_SKILL_WORDS)))
+_TECH_DESC_RE = re.compile("|".join(map(re.escape, TECH_DESCRIPTION_WORDS)))
+_SOFT_SKILL_RE = re.compile("|".join(map(re.escape, SOFT_SKILL_WORDS)))
+
+
 # =============================================================================
 # MAIN MATCHER CLASS
 # =============================================================================
@@ -214,48 +502,19 @@ class SkillMatcher:
         """
         logger.info(f"Matching {len(cv_skills)} CV skills against JD")
 
-        # Normalize all skills for comparison
-        cv_normalized = self._normalize_skill_list(cv_skills)
-        required_normalized = self._normalize_skill_list(jd.required_skills)
-        preferred_normalized = self._normalize_skill_list(jd.preferred_skills)
-
-        # Create lookup maps: normalized → original
-        # This lets us report the original skill names, not normalized ones
-        cv_lookup = self._create_lookup(cv_skills)
-        required_lookup = self._create_lookup(jd.required_skills)
-        preferred_lookup = self._create_lookup(jd.preferred_skills)
-
-        # Find matches and gaps
-        matched_required_norm = cv_normalized & required_normalized
-        matched_preferred_norm = cv_normalized & preferred_normalized
-        missing_required_norm = required_normalized - cv_normalized
-        missing_preferred_norm = preferred_normalized - cv_normalized
-        
-        # Extra skills: in CV but not in any JD category
-        all_jd_normalized = required_normalized | preferred_normalized
-        extra_norm = cv_normalized - all_jd_normalized
-
-        # Convert back to original names
-        matched_required = [required_lookup[n] for n in matched_required_norm]
-        matched_preferred = [preferred_lookup[n] for n in matched_preferred_norm]
-        missing_required = [required_lookup[n] for n in missing_required_norm]
-        missing_preferred = [preferred_lookup[n] for n in missing_preferred_norm]
-        extra_skills = [cv_lookup[n] for n in extra_norm]
-
-        # Calculate match score based on required skills only
-        if len(required_normalized) > 0:
-            match_score = len(matched_required_norm) / len(required_normalized)
-        else:
-            # No required skills specified = assume good match
-            match_score = 1.0
-
-        result = SkillMatchResult(
-            matched_required=sorted(matched_required),
-            matched_preferred=sorted(matched_preferred),
-            missing_required=sorted(missing_required),
-            missing_preferred=sorted(missing_preferred),
-            extra_skills=sorted(extra_skills),
-            match_score=match_score,
+        result = _match_skills_cached(
+            tuple(cv_skills), tuple(jd.required_skills), tuple(jd.preferred_skills)
+        )
+
+        # Fresh lists for the caller, so changing them can't alter the
+        # cached result that later calls will return
+        result = replace(
+            result,
+            matched_required=list(result.matched_required),
+            matched_preferred=list(result.matched_preferred),
+            missing_required=list(result.missing_required),
+            missing_preferred=list(result.missing_preferred),
+            extra_skills=list(result.extra_skills),
         )
 
         logger.info(f"Match result: {result}")
@@ -280,34 +539,39 @@ class SkillMatcher:
             jd: The job description
             
         Returns:
-            Annotated UserProfile (deep copy, original unchanged)
+            Annotated UserProfile (a copy, original unchanged)
         """
         logger.info(f"Full profile matching for: {profile.full_name}")
 
-        # Deep copy to avoid mutating original
-        annotated = deepcopy(profile)
-
         # Match skills list
         skill_result = self.match_skills(profile.skills, jd)
 
-        # Store the match result on the profile for later use
-        # We use a private attribute since it's not in the model
-        annotated._skill_match = skill_result
+        # Prepare the JD skills once for all sections
+        jd_index = self._build_jd_index(jd)
 
-        # Analyze each work experience section
-        for i, section in enumerate(annotated.work_experience):
-            analysis = self._analyze_section(section, jd)
-            annotated.work_experience[i].analysis = analysis
+        # Analyze every section in one batch: work experience, projects,
+        # and education (usually less relevant, but check anyway)
+        num_work = len(profile.work_experience)
+        num_projects = len(profile.projects)
+        analyzed = self._analyze_sections(
+            [*profile.work_experience, *profile.projects, *profile.education],
+            jd_index,
+        )
 
-        # Analyze each project section
-        for i, section in enumerate(annotated.projects):
-            analysis = self._analyze_section(section, jd)
-            annotated.projects[i].analysis = analysis
+        # Copy only what changes: new section lists holding copies of each
+        # section with its analysis set. Everything else (contact info,
+        # skills, bullets) is shared with the original, which is left as is.
+        # This avoids a deepcopy of the whole profile.
+        annotated = replace(
+            profile,
+            work_experience=analyzed[:num_work],
+            projects=analyzed[num_work:num_work + num_projects],
+            education=analyzed[num_work + num_projects:],
+        )
 
-        # Analyze education (usually less relevant, but check anyway)
-        for i, section in enumerate(annotated.education):
-            analysis = self._analyze_section(section, jd)
-            annotated.education[i].analysis = analysis
+        # Store the match result on the profile for later use
+        # We use a private attribute since it's not in the model
+        annotated._skill_match = skill_result
 
         return annotated
 
@@ -331,32 +595,7 @@ class SkillMatcher:
             "Python 3.10" → "python"
             "Node.JS" → "node"
         """
-        # Start with lowercase and stripped
-        normalized = skill.lower().strip()
-
-        # Remove common punctuation at edges
-        normalized = normalized.strip(".,;:-•")
-
-        # Remove version numbers (e.g., "Python 3.10" → "Python")
-        normalized = re.sub(r"\s*\d+(\.\d+)*\s*$", "", normalized)
-        normalized = re.sub(r"\s*v?\d+(\.\d+)*\s*$", "", normalized)
-
-        # Check aliases first (before removing suffixes)
-        if normalized in SKILL_ALIASES:
-            normalized = SKILL_ALIASES[normalized]
-
-        # Remove common suffixes if still present
-        suffixes_to_remove = [".js", ".py", ".ts", ".go", ".rs"]
-        for suffix in suffixes_to_remove:
-            if normalized.endswith(suffix):
-                normalized = normalized[:-len(suffix)]
-                break
-
-        # Check aliases again after suffix removal
-        if normalized in SKILL_ALIASES:
-            normalized = SKILL_ALIASES[normalized]
-
-        return normalized.strip()
+        return _normalize_skill_cached(skill)
 
     def _normalize_skill_list(self, skills: list[str]) -> set[str]:
         """
@@ -371,29 +610,78 @@ class SkillMatcher:
                 normalized.add(norm)
         return normalized
 
-    def _create_lookup(self, skills: list[str]) -> dict[str, str]:
-        """
-        Create a mapping from normalized → original skill name.
-        
-        This lets us report the original name (e.g., "React.js")
-        while matching on normalized form (e.g., "react").
-        """
-        lookup = {}
-        for skill in skills:
-            normalized = self._normalize_skill(skill)
-            if normalized and normalized not in lookup:
-                # Keep the first occurrence's casing
-                lookup[normalized] = skill
-        return lookup
-
     # =========================================================================
     # SECTION ANALYSIS
     # =========================================================================
 
+    def _build_jd_index(self, jd: JobDescription) -> JDIndex:
+        """
+        Lowercase and normalize the JD skills once, for all sections.
+        """
+        all_skills = list(jd.required_skills) + list(jd.preferred_skills)
+        all_skills_lower = [skill.lower() for skill in all_skills]
+        all_skills_norm = [self._normalize_skill(skill) for skill in all_skills]
+
+        num_required = len(jd.required_skills)
+        required_lower_norm = list(zip(
+            all_skills_lower[:num_required], all_skills_norm[:num_required]
+        ))
+
+        # Section text is scanned once with a lookahead alternation, longest
+        # form first, so each position reports the longest form starting
+        # there. Any shorter form starting at the same position is a prefix
+        # of it, so a hit on a form also marks every skill with a form that
+        # is a prefix of it — the same skills `in` would find.
+        forms = {form for form in all_skills_lower + all_skills_norm if form}
+        skills_by_mention = {
+            form: [
+                i for i, (skill_lower, skill_normalized) in enumerate(
+                    zip(all_skills_lower, all_skills_norm)
+                )
+                if (skill_lower and form.startswith(skill_lower))
+                or (skill_normalized and form.startswith(skill_normalized))
+            ]
+            for form in forms
+        }
+        mention_pattern = None
+        if forms:
+            mention_pattern = re.compile(
+                "(?=("
+                + "|".join(
+                    re.escape(form) for form in sorted(forms, key=len, reverse=True)
+                )
+                + "))"
+            )
+        always_mentioned = [
+            i for i, (skill_lower, skill_normalized) in enumerate(
+                zip(all_skills_lower, all_skills_norm)
+            )
+            if not skill_lower or not skill_normalized
+        ]
+
+        return JDIndex(
+            all_skills=all_skills,
+            required_lower_norm=required_lower_norm,
+            mention_pattern=mention_pattern,
+            skills_by_mention=skills_by_mention,
+            always_mentioned=always_mentioned,
+        )
+
+    def _analyze_sections(
+        self,
+        sections: list[CVSection],
+        jd_index: JDIndex,
+    ) -> list[CVSection]:
+        """Copies of the sections, each with its analysis filled in."""
+        return [
+            replace(section, analysis=self._analyze_section(section, jd_index))
+            for section in sections
+        ]
+
     def _analyze_section(
         self,
         section: CVSection,
-        jd: JobDescription,
+        jd_index: JDIndex,
     ) -> SectionAnalysis:
         """
         Analyze a single CV section for relevance to the JD.
@@ -407,25 +695,23 @@ class SkillMatcher:
             SectionAnalysis with matched skills, score, gaps, explanation
         """
         # Combine all text from the section
-        section_text = " ".join(section.description_points)
-        section_text += f" {section.title} {section.organization}"
-        section_text_lower = section_text.lower()
+        ctx = self._build_section_ctx(section)
+        section_text_lower = ctx.text_lower
 
         # All JD skills (both required and preferred)
-        all_jd_skills = jd.required_skills + jd.preferred_skills
-
-        # Find skills mentioned in this section
-        matched_skills = []
-        for skill in all_jd_skills:
-            # Check if skill appears in section text
-            skill_normalized = self._normalize_skill(skill)
-            
-            # Try to match both original and normalized forms
-            if (
-                skill.lower() in section_text_lower
-                or skill_normalized in section_text_lower
-            ):
-                matched_skills.append(skill)
+        all_jd_skills = jd_index.all_skills
+
+        # Find skills mentioned in this section (original or normalized
+        # form), with one scan of the text for all JD skills
+        mentioned = set(jd_index.always_mentioned)
+        if jd_index.mention_pattern is not None:
+            found = {
+                match.group(1)
+                for match in jd_index.mention_pattern.finditer(section_text_lower)
+            }
+            for form in found:
+                mentioned.update(jd_index.skills_by_mention[form])
+        matched_skills = [all_jd_skills[i] for i in sorted(mentioned)]
 
         # Calculate relevance score
         # Based on how many JD skills appear in this section
@@ -439,11 +725,11 @@ class SkillMatcher:
 
         # Find gaps: required skills that COULD be added here
         # (skills the section doesn't mention but might be relevant)
-        gaps = self._find_section_gaps(section, jd, matched_skills)
+        gaps = self._find_section_gaps(ctx, jd_index, matched_skills)
 
         # Build explanation
         explanation = self._build_section_explanation(
-            section, matched_skills, relevance_score, jd
+            section, matched_skills, relevance_score
         )
 
         return SectionAnalysis(
@@ -453,10 +739,24 @@ class SkillMatcher:
             explanation=explanation,
         )
 
+    def _build_section_ctx(self, section: CVSection) -> SectionCtx:
+        """
+        Lowercase a section's text once and run its role/description checks.
+        """
+        description = " ".join(section.description_points)
+
+        return SectionCtx(
+            text_lower=f"{description} {section.title} {section.organization}".lower(),
+            is_tech_role=_TECH_ROLE_RE.search(section.title.lower()) is not None,
+            has_tech_description=(
+                _TECH_DESC_RE.search(description.lower()) is not None
+            ),
+        )
+
     def _find_section_gaps(
         self,
-        section: CVSection,
-        jd: JobDescription,
+        ctx: SectionCtx,
+        jd_index: JDIndex,
         already_matched: list[str],
     ) -> list[str]:
         """
@@ -471,22 +771,22 @@ class SkillMatcher:
         gaps = []
         matched_normalized = self._normalize_skill_list(already_matched)
 
-        # Only look at required skills for gaps
-        for skill in jd.required_skills:
-            skill_normalized = self._normalize_skill(skill)
-
+        # Only look at required skills for gaps (the head of all_skills)
+        for skill, (skill_lower, skill_normalized) in zip(
+            jd_index.all_skills, jd_index.required_lower_norm
+        ):
             # Skip if already matched
             if skill_normalized in matched_normalized:
                 continue
 
             # Check if this skill could plausibly fit
-            if self._skill_could_fit_section(skill, section):
+            if self._skill_could_fit_section(skill_lower, ctx):
                 gaps.append(skill)
 
         # Limit to 5 gaps per section (don't overwhelm)
         return gaps[:5]
 
-    def _skill_could_fit_section(self, skill: str, section: CVSection) -> bool:
+    def _skill_could_fit_section(self, skill_lower: str, ctx: SectionCtx) -> bool:
         """
         Heuristic: Could this skill plausibly be mentioned in this section?
         
@@ -497,55 +797,18 @@ class SkillMatcher:
         
         This is imperfect but better than suggesting SQL to a barista job.
         """
-        skill_lower = skill.lower()
-        title_lower = section.title.lower()
-        org_lower = section.organization.lower()
-        description_lower = " ".join(section.description_points).lower()
-
-        # Technical role indicators
-        tech_role_words = [
-            "engineer", "developer", "programmer", "architect",
-            "scientist", "analyst", "devops", "sre", "infrastructure",
-            "software", "frontend", "backend", "fullstack", "full-stack",
-            "data", "ml", "machine learning", "ai",
-        ]
-
-        # Check if this is a technical role
-        is_tech_role = any(word in title_lower for word in tech_role_words)
-
-        # Technical skill indicators
-        tech_skill_words = [
-            "python", "java", "react", "node", "sql", "aws", "docker",
-            "kubernetes", "api", "database", "cloud", "linux", "git",
-        ]
-
-        is_tech_skill = any(word in skill_lower for word in tech_skill_words)
+        is_tech_skill = _TECH_SKILL_RE.search(skill_lower) is not None
 
         # If tech skill and tech role, likely fits
-        if is_tech_skill and is_tech_role:
+        if is_tech_skill and ctx.is_tech_role:
             return True
 
         # If description mentions technical terms, skill might fit
-        tech_description_words = [
-            "code", "develop", "build", "implement", "deploy",
-            "software", "application", "system", "platform",
-            "database", "api", "service", "infrastructure",
-        ]
-
-        has_tech_description = any(
-            word in description_lower for word in tech_description_words
-        )
-
-        if is_tech_skill and has_tech_description:
+        if is_tech_skill and ctx.has_tech_description:
             return True
 
         # Management/soft skills fit most roles
-        soft_skills = [
-            "leadership", "management", "communication", "teamwork",
-            "agile", "scrum", "project management",
-        ]
-
-        if any(word in skill_lower for word in soft_skills):
+        if _SOFT_SKILL_RE.search(skill_lower) is not None:
             return True
 
         # Default: don't suggest (conservative)
@@ -556,7 +819,6 @@ class SkillMatcher:
         section: CVSection,
         matched_skills: list[str],
         score: float,
-        jd: JobDescription,
     ) -> str:
         """
         Build a human-readable explanation for this section's relevance.
@@ -573,17 +835,15 @@ class SkillMatcher:
         else:
             level = "Less directly relevant"
 
-        parts = [level + "."]
-
         if matched_skills:
-            skill_list = ", ".join(matched_skills[:4])
+            more = ""
             if len(matched_skills) > 4:
-                skill_list += f" (+{len(matched_skills) - 4} more)"
-            parts.append(f"Mentions: {skill_list}.")
+                more = f" (+{len(matched_skills) - 4} more)"
+            detail = f"Mentions: {', '.join(matched_skills[:4])}{more}."
         else:
-            parts.append("No direct skill matches found.")
+            detail = "No direct skill matches found."
 
-        return " ".join(parts)
+        return f"{level}. {detail}"
 
     # =========================================================================
     # UTILITY METHODS
@@ -614,10 +874,5 @@ class SkillMatcher:
 
     def _score_to_status(self, score: float) -> str:
         """Convert match score to human-readable status."""
-        if score >= 0.7:
-            return "strong"
-        elif score >= 0.4:
-            return "moderate"
-        else:
-            return "needs_work"
+        return _STATUS_NAMES[bisect_right(_STATUS_THRESHOLDS, score)]
 
@@ -122,18 +122,15 @@ def render_tailored_cv(result, state):
     if result.tailored_skills:
         # Show skills with matched ones highlighted
         if state and state.skill_match_result:
-            matched_set = set(
-                s.lower() for s in state.skill_match_result.matched_required
-            )
-            matched_pref_set = set(
-                s.lower() for s in state.skill_match_result.matched_preferred
-            )
+            matched_set = state.skill_match_result.matched_required_lower
+            matched_pref_set = state.skill_match_result.matched_preferred_lower
             
             skill_display = []
             for skill in result.tailored_skills:
-                if skill.lower() in matched_set:
+                skill_lower = skill.lower()
+                if skill_lower in matched_set:
                     skill_display.append(f"**{skill}** ✓")
-                elif skill.lower() in matched_pref_set:
+                elif skill_lower in matched_pref_set:
                     skill_display.append(f"**{skill}**")
                 else:
                     skill_display.append(skill)
@@ -169,8 +166,8 @@ def render_tailored_cv(result, state):
     # === COPY BUTTON ===
     st.markdown("---")
     
-    # Generate copyable text
-    cv_text = generate_copyable_cv(result, profile)
+    # Generate copyable text (once per result, not on every rerun)
+    cv_text = get_copyable_cv(result, profile)
     
     st.download_button(
         label="📋 Download as Text",
@@ -248,12 +245,12 @@ def render_explanations(result):
     # Gaps reminder
     state = st.session_state.pipeline_state
     if state and state.skill_match_result:
-        missing = state.skill_match_result.missing_required
+        missing = state.skill_match_result.missing_required_preview
         if missing:
             st.markdown("#### Skills to Consider")
             st.warning(
                 f"The job requires these skills you haven't mentioned: "
-                f"**{', '.join(missing[:5])}**. "
+                f"**{', '.join(missing)}**. "
                 f"If you have experience with any of these, consider adding them."
             )
 
@@ -262,6 +259,24 @@ def render_explanations(result):
 # HELPER FUNCTIONS
 # =============================================================================
 
+def get_copyable_cv(result, profile) -> str:
+    """
+    The plain text CV for this result, built on first use and then kept
+    in session state so Streamlit reruns don't rebuild it.
+    
+    Keyed on the result object itself (not id(result), which a new result
+    could reuse); holding it also keeps it alive. The profile is the
+    result's original_profile, so the result alone identifies the text.
+    """
+    cached = st.session_state.get("_cv_text_cache")
+    if cached is not None and cached[0] is result:
+        return cached[1]
+
+    cv_text = generate_copyable_cv(result, profile)
+    st.session_state._cv_text_cache = (result, cv_text)
+    return cv_text
+
+
 def generate_copyable_cv(result, profile) -> str:
     """
     Generate a plain text version of the tailored CV.
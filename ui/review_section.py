@@ -13,6 +13,27 @@ Design principles:
 import streamlit as st
 from typing import Optional
 
+from services.explanation_engine import format_section_name
+
+
+# How many skills each Skills Analysis list shows
+SKILL_LIST_LIMIT = 10
+
+# How much of a suggestion's text the card shows
+SUGGESTION_PREVIEW_CHARS = 200
+
+# Suggestion card actions and the status each one sets (no choice = pending)
+_ACTION_OPTIONS = ("✅ Accept", "⏭️ Skip")
+_ACTION_STATUS = {"✅ Accept": "accepted", "⏭️ Skip": "dismissed", None: "pending"}
+_STATUS_ACTION = {"accepted": "✅ Accept", "dismissed": "⏭️ Skip"}
+
+# Statuses that collapse a card to its summary line, with their labels
+_DECIDED_LABELS = {"accepted": "Accepted", "dismissed": "Skipped"}
+
+# Suggestion card title icon per status (anything else shows as pending)
+_STATUS_ICONS = {"accepted": "✅", "dismissed": "⏭️"}
+_PENDING_ICON = "📝"
+
 
 # =============================================================================
 # MAIN RENDER FUNCTION
@@ -93,15 +114,16 @@ def render_match_summary(result, state):
     """
     Show a quick summary of the match analysis.
     """
+    skill_result = state.skill_match_result if state else None
+
     col1, col2, col3, col4 = st.columns(4)
 
     # Match score
     with col1:
-        if state and state.skill_match_result:
-            score = state.skill_match_result.match_score
+        if skill_result:
             st.metric(
                 label="Match Score",
-                value=f"{score:.0%}",
+                value=f"{skill_result.match_score:.0%}",
                 help="Percentage of required skills you have",
             )
         else:
@@ -109,11 +131,10 @@ def render_match_summary(result, state):
 
     # Matched skills
     with col2:
-        if state and state.skill_match_result:
-            matched = len(state.skill_match_result.matched_required)
+        if skill_result:
             st.metric(
                 label="Skills Matched",
-                value=matched,
+                value=len(skill_result.matched_required),
                 help="Required skills found in your CV",
             )
         else:
@@ -121,11 +142,10 @@ def render_match_summary(result, state):
 
     # Missing skills
     with col3:
-        if state and state.skill_match_result:
-            missing = len(state.skill_match_result.missing_required)
+        if skill_result:
             st.metric(
                 label="Skills Gaps",
-                value=missing,
+                value=len(skill_result.missing_required),
                 help="Required skills not found in your CV",
             )
         else:
@@ -140,33 +160,44 @@ def render_match_summary(result, state):
         )
 
     # Show matched skills
-    if state and state.skill_match_result:
-        skill_result = state.skill_match_result
-        
+    if skill_result:
         with st.expander("🎯 Skills Analysis", expanded=False):
             col1, col2 = st.columns(2)
             
+            matched_md, missing_md = _format_skill_lists(
+                tuple(skill_result.matched_required),
+                tuple(skill_result.missing_required),
+            )
+
             with col1:
                 st.markdown("**✅ Skills You Have (Required)**")
-                if skill_result.matched_required:
-                    for skill in skill_result.matched_required[:10]:
-                        st.markdown(f"- {skill}")
-                else:
-                    st.markdown("*None matched*")
+                st.markdown(matched_md or "*None matched*")
 
             with col2:
                 st.markdown("**❌ Skills Gaps (Required)**")
-                if skill_result.missing_required:
-                    for skill in skill_result.missing_required[:10]:
-                        st.markdown(f"- {skill}")
-                else:
-                    st.markdown("*No gaps — great match!*")
+                st.markdown(missing_md or "*No gaps — great match!*")
+
+
+@st.cache_data(show_spinner=False)
+def _format_skill_lists(matched: tuple, missing: tuple) -> tuple[str, str]:
+    """
+    The first SKILL_LIST_LIMIT matched and missing skills, each as one
+    markdown bullet list ("" if there are none).
+    
+    One markdown element per list instead of one per skill, built once
+    per skill result rather than on every rerun.
+    """
+    return (
+        "\n".join(f"- {skill}" for skill in matched[:SKILL_LIST_LIMIT]),
+        "\n".join(f"- {skill}" for skill in missing[:SKILL_LIST_LIMIT]),
+    )
 
 
 # =============================================================================
 # SUGGESTION CARD
 # =============================================================================
 
+@st.fragment
 def render_suggestion_card(index: int, suggestion):
     """
     Render a single suggestion as an expandable card.
@@ -176,41 +207,58 @@ def render_suggestion_card(index: int, suggestion):
     - Suggested text (highlighted)
     - Reason for the change
     - Accept/Skip buttons
+    
+    Once accepted or skipped, the card shrinks to a summary line with an
+    Edit button that reopens it.
+    
+    A fragment: choosing Accept/Skip reruns just this card, not the whole
+    app. Nothing outside the card depends on its status.
     """
     # Create a unique key for this suggestion
     key_prefix = f"suggestion_{index}"
 
-    # Get current status from session state (or default to pending)
-    status_key = f"{key_prefix}_status"
-    if status_key not in st.session_state:
-        st.session_state[status_key] = suggestion.status
-
-    current_status = st.session_state[status_key]
-
-    # Determine expander icon based on status
-    if current_status == "accepted":
-        icon = "✅"
-        border_color = "green"
-    elif current_status == "dismissed":
-        icon = "⏭️"
-        border_color = "gray"
+    # The Accept/Skip control's value is the status. Before its first
+    # render there is no widget state yet, so the suggestion's own status
+    # stands (and seeds the control's default below).
+    action_key = f"{key_prefix}_action"
+    if action_key in st.session_state:
+        current_status = _ACTION_STATUS[st.session_state[action_key]]
+        # Update the actual suggestion object
+        suggestion.status = current_status
     else:
-        icon = "📝"
-        border_color = "blue"
+        current_status = suggestion.status
 
-    # Expander title
+    # Expander title, with an icon for the status
+    icon = _STATUS_ICONS.get(current_status, _PENDING_ICON)
     title = f"{icon} Suggestion {index + 1}"
     if suggestion.section_name:
-        title += f" ({suggestion.section_name.replace('_', ' ').title()})"
+        title += f" ({format_section_name(suggestion.section_name)})"
+
+    # Decided suggestions collapse to one line with an Edit button; the
+    # full card (texts, reason, action control) is only built while the
+    # suggestion is still open for review
+    if current_status in _DECIDED_LABELS:
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.caption(f"{title} — {_DECIDED_LABELS[current_status]}")
+        with col2:
+            st.button(
+                "✏️ Edit",
+                key=f"{key_prefix}_edit",
+                use_container_width=True,
+                on_click=_reopen_suggestion,
+                args=(suggestion, action_key),
+            )
+        return
 
     with st.expander(title, expanded=(current_status == "pending")):
         # Original text
         st.markdown("**Original:**")
-        st.text(suggestion.original_text[:200] + "..." if len(suggestion.original_text) > 200 else suggestion.original_text)
+        st.text(_preview(suggestion.original_text))
 
         # Suggested text
         st.markdown("**Suggested:**")
-        st.success(suggestion.suggested_text[:200] + "..." if len(suggestion.suggested_text) > 200 else suggestion.suggested_text)
+        st.success(_preview(suggestion.suggested_text))
 
         # Reason
         if suggestion.reason:
@@ -228,26 +276,32 @@ def render_suggestion_card(index: int, suggestion):
                 f"⚠️ Confidence: {suggestion.confidence:.0%} — Please review carefully"
             )
 
-        # Action buttons
+        # Action control: one widget, Accept or Skip. Choosing reruns this
+        # fragment, which picks the new status up at the top and collapses
+        # the card to its summary line.
         st.markdown("---")
-        col1, col2, col3 = st.columns([1, 1, 2])
+        st.segmented_control(
+            "Action",
+            list(_ACTION_OPTIONS),
+            key=action_key,
+            default=_STATUS_ACTION.get(suggestion.status),
+            label_visibility="collapsed",
+        )
 
-        with col1:
-            if st.button("✅ Accept", key=f"{key_prefix}_accept", use_container_width=True):
-                st.session_state[status_key] = "accepted"
-                # Update the actual suggestion object
-                suggestion.status = "accepted"
-                st.rerun()
 
-        with col2:
-            if st.button("⏭️ Skip", key=f"{key_prefix}_skip", use_container_width=True):
-                st.session_state[status_key] = "dismissed"
-                suggestion.status = "dismissed"
-                st.rerun()
+def _reopen_suggestion(suggestion, action_key: str):
+    """
+    Edit button callback: put a decided suggestion back to pending.
+    
+    Clearing the action control's state makes the card fall back to the
+    suggestion's status, so the full card comes back with nothing chosen.
+    """
+    suggestion.status = "pending"
+    st.session_state.pop(action_key, None)
 
-        # Show current status
-        if current_status == "accepted":
-            st.success("✓ Accepted")
-        elif current_status == "dismissed":
-            st.info("Skipped")
 
+def _preview(text: str) -> str:
+    """The first SUGGESTION_PREVIEW_CHARS of text, with "..." if cut."""
+    if len(text) > SUGGESTION_PREVIEW_CHARS:
+        return text[:SUGGESTION_PREVIEW_CHARS] + "..."
+    return text
@@ -10,7 +10,10 @@ Design principles:
 - No overwhelming options
 """
 
+import json
+
 import streamlit as st
+import streamlit.components.v1 as components
 
 
 # =============================================================================
@@ -84,6 +87,85 @@ Nice to Have
 """
 
 
+# =============================================================================
+# STATIC TEXT
+# =============================================================================
+
+# Body of the "Tips for better results" expander (static, built once)
+TIPS_MD = """
+**For your resume:**
+- Paste the full text, including all sections
+- Include your name, contact info, experience, education, and skills
+- Don't worry about formatting — we only analyze the content
+
+**For the job description:**
+- Include the full posting, not just the title
+- The more detail, the better we can match your skills
+- Include requirements, responsibilities, and "nice to haves"
+
+**What we analyze:**
+- Skills mentioned in both documents
+- Experience relevance to the role
+- Gaps between your profile and job requirements
+"""
+
+
+# =============================================================================
+# HELPER FUNCTIONS
+# =============================================================================
+
+def _live_char_count(textarea_label: str, initial_chars: int):
+    """
+    Show "📝 N characters" under a text area, recounted in the browser on
+    every input (the form only sends its text on submit); initial_chars
+    is shown until the first edit.
+    
+    Relies on Streamlit internals: the same-origin component iframe can
+    reach window.parent.document, and the text area's aria-label is its
+    widget label.
+    """
+    components.html(
+        f"""
+        <span id="count" style="font-family: sans-serif; font-size: 14px;
+              color: rgba(49, 51, 63, 0.6);"></span>
+        <script>
+        const label = {json.dumps(textarea_label)};
+        const count = document.getElementById("count");
+        const show = (n) => {{
+            count.textContent = n > 0 ? `📝 ${{n}} characters` : "";
+        }};
+        show({initial_chars});
+        const textarea = window.parent.document.querySelector(
+            `textarea[aria-label="${{label}}"]`
+        );
+        // The iframe is recreated on every rerun but the text area is
+        // not, so bind one listener and point it at the newest caption
+        if (textarea) {{
+            textarea.charCountShow = show;
+            if (!textarea.dataset.charCountBound) {{
+                textarea.dataset.charCountBound = "1";
+                textarea.addEventListener("input", (e) => {{
+                    e.target.charCountShow([...e.target.value.trim()].length);
+                }});
+            }}
+        }}
+        </script>
+        """,
+        height=24,
+    )
+
+
+def _load_sample(state_key: str, sample: str):
+    """
+    Button callback: put a sample into session state.
+    
+    Callbacks run before the rerun the click triggers, so that rerun
+    already shows the sample (no second st.rerun() needed). Session state
+    holds a reference to the module constant, not a copy.
+    """
+    st.session_state[state_key] = sample
+
+
 # =============================================================================
 # MAIN RENDER FUNCTION
 # =============================================================================
@@ -101,118 +183,120 @@ def render_upload_section():
         "We'll analyze both and suggest targeted improvements."
     )
 
-    # Two-column layout for CV and JD
+    # Two-column layout for CV and JD: headings and sample buttons first.
+    # The buttons stay outside the form below, since loading a sample must
+    # take effect straight away to fill in the text area.
     col1, col2 = st.columns(2)
 
     # === LEFT COLUMN: CV ===
     with col1:
         st.subheader("Your Resume")
         st.markdown("*Paste the text content of your resume*")
-        
-        # Text area for CV
-        cv_text = st.text_area(
-            label="Resume Text",
-            value=st.session_state.raw_cv_text,
-            height=400,
-            placeholder="Paste your resume here...\n\nTip: Copy from your Word/Google Doc or PDF",
-            key="cv_input",
-            label_visibility="collapsed",
-        )
-        
-        # Update session state
-        st.session_state.raw_cv_text = cv_text
-
-        # Character count
-        cv_chars = len(cv_text.strip())
-        if cv_chars > 0:
-            st.caption(f"📝 {cv_chars} characters")
-        
+
         # Load sample button
-        if st.button("📋 Load Sample CV", key="load_sample_cv", use_container_width=True):
-            st.session_state.raw_cv_text = SAMPLE_CV
-            st.rerun()
+        st.button(
+            "📋 Load Sample CV",
+            key="load_sample_cv",
+            use_container_width=True,
+            on_click=_load_sample,
+            args=("raw_cv_text", SAMPLE_CV),
+        )
 
     # === RIGHT COLUMN: JD ===
     with col2:
         st.subheader("Job Description")
         st.markdown("*Paste the job posting you're applying to*")
-        
-        # Text area for JD
-        jd_text = st.text_area(
-            label="Job Description Text",
-            value=st.session_state.raw_jd_text,
-            height=400,
-            placeholder="Paste the job description here...\n\nTip: Copy from LinkedIn, company website, etc.",
-            key="jd_input",
-            label_visibility="collapsed",
-        )
-        
-        # Update session state
-        st.session_state.raw_jd_text = jd_text
-
-        # Character count
-        jd_chars = len(jd_text.strip())
-        if jd_chars > 0:
-            st.caption(f"📝 {jd_chars} characters")
-        
+
         # Load sample button
-        if st.button("📋 Load Sample JD", key="load_sample_jd", use_container_width=True):
-            st.session_state.raw_jd_text = SAMPLE_JD
-            st.rerun()
+        st.button(
+            "📋 Load Sample JD",
+            key="load_sample_jd",
+            use_container_width=True,
+            on_click=_load_sample,
+            args=("raw_jd_text", SAMPLE_JD),
+        )
 
-    # === VALIDATION AND PROCEED ===
-    st.markdown("---")
+    # The text areas live in a form, so typing or pasting doesn't rerun
+    # the app; their values are sent together when Analyze is clicked
+    with st.form("upload_form", clear_on_submit=False, border=False):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # Text area for CV
+            cv_text = st.text_area(
+                label="Resume Text",
+                value=st.session_state.raw_cv_text,
+                height=400,
+                placeholder="Paste your resume here...\n\nTip: Copy from your Word/Google Doc or PDF",
+                key="cv_input",
+                label_visibility="collapsed",
+            )
 
-    # Validate inputs
-    cv_valid = len(st.session_state.raw_cv_text.strip()) >= 100
-    jd_valid = len(st.session_state.raw_jd_text.strip()) >= 50
+            # Update session state
+            st.session_state.raw_cv_text = cv_text
+
+            # Character count (kept for validation below; the caption
+            # itself updates live in the browser as the user types)
+            cv_chars = len(cv_text.strip())
+            _live_char_count("Resume Text", cv_chars)
+
+        with col2:
+            # Text area for JD
+            jd_text = st.text_area(
+                label="Job Description Text",
+                value=st.session_state.raw_jd_text,
+                height=400,
+                placeholder="Paste the job description here...\n\nTip: Copy from LinkedIn, company website, etc.",
+                key="jd_input",
+                label_visibility="collapsed",
+            )
 
-    # Show validation messages
-    if not cv_valid and st.session_state.raw_cv_text.strip():
-        st.warning("⚠️ Your resume seems too short. Please paste the full content.")
-    
-    if not jd_valid and st.session_state.raw_jd_text.strip():
-        st.warning("⚠️ The job description seems too short. Please paste the full posting.")
+            # Update session state
+            st.session_state.raw_jd_text = jd_text
 
-    # Proceed button
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if cv_valid and jd_valid:
-            if st.button(
-                "🚀 Analyze My Resume",
-                type="primary",
-                use_container_width=True,
-            ):
-                # Move to processing step
-                st.session_state.current_step = "processing"
-                st.session_state.processing_complete = False
-                st.session_state.processing_error = None
-                st.rerun()
-        else:
-            st.button(
+            # Character count (kept for validation below; the caption
+            # itself updates live in the browser as the user types)
+            jd_chars = len(jd_text.strip())
+            _live_char_count("Job Description Text", jd_chars)
+
+        # === VALIDATION AND PROCEED ===
+        st.markdown("---")
+
+        # Proceed button
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            submitted = st.form_submit_button(
                 "🚀 Analyze My Resume",
                 type="primary",
                 use_container_width=True,
-                disabled=True,
             )
-            if not cv_valid or not jd_valid:
-                st.caption("Please paste both your resume and the job description to continue.")
+
+    # Validate inputs (the counts above are of the same, stored text)
+    cv_valid = cv_chars >= 100
+    jd_valid = jd_chars >= 50
+
+    # Show validation messages. Each goes in a placeholder that is always
+    # there, so a warning appearing or clearing updates that one element
+    # instead of shifting everything rendered after it.
+    cv_warn_slot = st.empty()
+    jd_warn_slot = st.empty()
+
+    if not cv_valid and cv_chars:
+        cv_warn_slot.warning("⚠️ Your resume seems too short. Please paste the full content.")
+    
+    if not jd_valid and jd_chars:
+        jd_warn_slot.warning("⚠️ The job description seems too short. Please paste the full posting.")
+
+    if submitted:
+        if cv_valid and jd_valid:
+            # Move to processing step
+            st.session_state.current_step = "processing"
+            st.session_state.processing_complete = False
+            st.session_state.processing_error = None
+            st.rerun()
+        else:
+            st.caption("Please paste both your resume and the job description to continue.")
 
     # === TIPS SECTION ===
     with st.expander("💡 Tips for better results"):
-        st.markdown("""
-        **For your resume:**
-        - Paste the full text, including all sections
-        - Include your name, contact info, experience, education, and skills
-        - Don't worry about formatting — we only analyze the content
-        
-        **For the job description:**
-        - Include the full posting, not just the title
-        - The more detail, the better we can match your skills
-        - Include requirements, responsibilities, and "nice to haves"
-        
-        **What we analyze:**
-        - Skills mentioned in both documents
-        - Experience relevance to the role
-        - Gaps between your profile and job requirements
-        """)
+        st.markdown(TIPS_MD)